@@ -3,9 +3,10 @@
 Dependencies
 - Python 3.9+
 - pandas
-- pdfplumber
+- pdfplumber (default text backend) or PyMuPDF (set PORT_KPI_BACKEND=pymupdf)
 - camelot (optional fallback)
 - pyarrow (optional, for parquet output)
+- polars (optional, faster output build/sort/write; pandas is used otherwise)
 
 Observed structure (sampled before coding)
 - 2020: "Port Terminals 2020.pdf" (page with KPI table contains heading and a 4-period table)
@@ -26,10 +27,14 @@ How to test (numbered steps)
 from __future__ import annotations
 
 import argparse
+import csv
 import json
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -37,16 +42,24 @@ import pandas as pd
 
 try:
     import pdfplumber
-except ImportError as exc:  # pragma: no cover
-    raise RuntimeError(
-        "pdfplumber is required. Install with: python -m pip install pdfplumber"
-    ) from exc
+except ImportError:  # pragma: no cover - PyMuPDF backend may be used instead
+    pdfplumber = None
+
+try:
+    import pymupdf  # type: ignore
+except ImportError:  # pragma: no cover - optional faster text backend
+    pymupdf = None
 
 try:
     import camelot  # type: ignore
 except Exception:
     camelot = None
 
+try:
+    import polars as pl
+except ImportError:  # pragma: no cover - pandas fallback
+    pl = None
+
 
 YEARS = [2020, 2021, 2022, 2023, 2024, 2025]
 BASE_DIR = Path("data/reports/annual_results")
@@ -54,6 +67,38 @@ OUTPUT_DIR = Path("data/processed/port_terminals_kpis")
 OUTPUT_LONG_CSV = OUTPUT_DIR / "port_terminals_kpis_long.csv"
 OUTPUT_LONG_PARQUET = OUTPUT_DIR / "port_terminals_kpis_long.parquet"
 LOG_PATH = OUTPUT_DIR / "ingestion_log.json"
+SORT_COLUMNS = ["report_year", "kpi_section", "kpi_name"]
+
+# Output schema. Rows are accumulated column-wise (one list per name) in this order.
+COLUMNS = [
+    "report_year",
+    "kpi_section",
+    "kpi_name",
+    "terminal_or_scope",
+    "submetric",
+    "unit",
+    "period_left_label",
+    "period_left_value",
+    "period_mid_label",
+    "period_mid_value",
+    "period_right_label",
+    "period_right_value",
+    "period_next_label",
+    "period_next_value",
+    "period_extra_labels",
+    "period_extra_values",
+    "source_pdf",
+    "source_page_start",
+    "source_page_end",
+    "extraction_confidence",
+]
+EXTRA_COLUMNS = ("period_extra_labels", "period_extra_values")
+# Period extras are lists in memory and Parquet; CSV files store them joined with this separator.
+EXTRA_SEPARATOR = "|"
+INT_COLUMNS = frozenset({"report_year", "source_page_start", "source_page_end"})
+FLOAT_COLUMNS = frozenset(
+    {name for name in COLUMNS if name.endswith("_value")} | {"extraction_confidence"}
+)
 
 SECTION_HEADING = "overview of key performance indicators"
 HEADER_HINTS = [
@@ -61,7 +106,7 @@ HEADER_HINTS = [
     "key performance area",
 ]
 
-SECTION_NAMES = {
+SECTION_NAMES = frozenset({
     "financial sustainability",
     "capacity creation and maintenance",
     "operational performance",
@@ -69,13 +114,16 @@ SECTION_NAMES = {
     "sustainable developmental outcomes",
     "operational performance continued",
     "financial sustainability continued",
-}
+})
 
-STOP_KEYWORDS = {
+STOP_KEYWORDS = frozenset({
     "financial performance review",
     "performance commentary",
     "financial performance",
-}
+})
+
+# Page-scan bound: give up on the heading search after this many pages.
+MAX_HEADING_SCAN_PAGES = 200
 
 UNIT_PHRASES = [
     "moves per gross crane hour",
@@ -117,6 +165,41 @@ VALUE_PATTERN = re.compile(
     r"(?:n/?a|N/?A)|\d{1,3}(?:[\s,]\d{3})*(?:[.,]\d+)?"
 )
 
+# Compiled once at import; these run for every extracted line.
+# Longest phrases first so e.g. "'000 teus" wins over "teus" at the same position.
+UNIT_ALT = re.compile(
+    r"(?:^|\s)("
+    + "|".join(re.escape(unit) for unit in sorted(UNIT_PHRASES, key=len, reverse=True))
+    + r")\s*$",
+    re.IGNORECASE,
+)
+UNIT_LOOKUP = {unit.lower(): unit for unit in UNIT_PHRASES}
+TERMINAL_RE = re.compile("|".join(TERMINAL_MARKERS), re.IGNORECASE)
+# One scan per line instead of one substring test per keyword/hint.
+_STOP_RE = re.compile("|".join(re.escape(k) for k in sorted(STOP_KEYWORDS)))
+_HEADER_RE = re.compile("|".join(re.escape(h) for h in HEADER_HINTS))
+
+_YEAR_RE = re.compile(r"20\d{2}")
+_STATUS_RE = re.compile(r"(Actual|Target|Budget|Forecast)", re.IGNORECASE)
+_YEAR_ONLY_LINE_RE = re.compile(r"(20\d{2}\s+)+20\d{2}")
+_BULLET_CHARS = "\u2013\u2014-\u2022"
+_BULLET_PREFIXES = tuple(_BULLET_CHARS)
+_FOOTNOTE_RE = re.compile(r"(\D)\d+$")
+_WS_RE = re.compile(r"\s+")
+_DIGIT_RE = re.compile(r"\d")
+
+# Dashes/bullets become "-" and curly quotes become "'" in a single pass.
+_PUNCT_TRANS = str.maketrans(
+    {"\u2013": "-", "\u2014": "-", "\u2022": "-", "\u2019": "'", "\u2018": "'"}
+)
+
+_NA_VALUES = frozenset({"n/a", "na", "-", "\u2013"})
+_VALUE_TRANS = str.maketrans({" ": None, "\u00a0": None, "%": None})
+
+# Running headers/footers and continuation banners that never carry KPI values.
+_SKIP_CONTAINS = ("transnet port terminals",)
+_SKIP_PREFIXES = ("port terminals", "contents", "operational performance continued")
+
 
 @dataclass
 class ParseState:
@@ -124,42 +207,98 @@ class ParseState:
     current_kpi: Optional[str] = None
 
 
+class PdfDocument:
+    """Page text access over the selected backend (pdfplumber or PyMuPDF)."""
+
+    def __init__(self, pdf_path: Path, backend: str) -> None:
+        self.backend = backend
+        if backend == "pymupdf":
+            if pymupdf is None:
+                raise RuntimeError(
+                    "PyMuPDF is required for PORT_KPI_BACKEND=pymupdf. "
+                    "Install with: python -m pip install pymupdf"
+                )
+            self._doc = pymupdf.open(str(pdf_path))
+            self._pages = None
+        elif backend == "pdfplumber":
+            if pdfplumber is None:
+                raise RuntimeError(
+                    "pdfplumber is required. Install with: python -m pip install pdfplumber"
+                )
+            self._doc = pdfplumber.open(pdf_path)
+            self._pages = self._doc.pages
+        else:
+            raise ValueError(f"Unknown PDF backend: {backend}")
+        # Normalized page text, filled lazily so each page is extracted at most once.
+        self._texts: List[Optional[str]] = [None] * len(self)
+
+    def __enter__(self) -> "PdfDocument":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._doc.close()
+
+    def __len__(self) -> int:
+        if self._pages is None:
+            return len(self._doc)
+        return len(self._pages)
+
+    def page_text(self, index: int) -> str:
+        if self._pages is None:
+            return self._doc[index].get_text("text")
+        return self._pages[index].extract_text() or ""
+
+    def normalized_text(self, index: int) -> str:
+        text = self._texts[index]
+        if text is None:
+            text = normalize_line(self.page_text(index))
+            self._texts[index] = text
+        return text
+
+
+def resolve_pdf_backend() -> str:
+    # PORT_KPI_BACKEND wins; otherwise prefer pdfplumber so default output is unchanged.
+    backend = os.environ.get("PORT_KPI_BACKEND", "").strip().lower()
+    if backend:
+        return backend
+    return "pdfplumber" if pdfplumber is not None else "pymupdf"
+
+
+def new_columns() -> Dict[str, list]:
+    return {name: [] for name in COLUMNS}
+
+
+def column_row_count(columns: Dict[str, list]) -> int:
+    return len(columns[COLUMNS[0]])
+
+
 def normalize_text(value: str) -> str:
-    text = str(value).strip().lower()
-    text = text.replace("\n", " ")
-    text = text.replace("\u2013", "-").replace("\u2014", "-").replace("\u2022", "-")
-    text = text.replace("\u2019", "'").replace("\u2018", "'")
-    text = re.sub(r"\s+", " ", text)
-    return text
+    text = str(value).translate(_PUNCT_TRANS).lower()
+    return _WS_RE.sub(" ", text).strip()
 
 
 def normalize_line(value: str) -> str:
-    text = str(value).replace("\u2013", "-").replace("\u2014", "-").replace("\u2022", "-")
-    text = text.replace("\u2019", "'").replace("\u2018", "'")
-    return text
+    return str(value).translate(_PUNCT_TRANS)
 
 
 def clean_kpi_name(value: str) -> str:
     text = value.strip()
-    text = re.sub(r"\s+", " ", text)
+    text = _WS_RE.sub(" ", text)
     # Remove trailing footnote numbers (e.g., "turnaround time3") but keep pier numbers.
     if not looks_like_terminal(text):
-        text = re.sub(r"(\D)\d+$", r"\1", text).strip()
+        text = _FOOTNOTE_RE.sub(r"\1", text).strip()
     return text
 
 
 def normalize_unit_text(unit: str) -> str:
-    text = unit.replace("\u2019", "'").replace("\u2018", "'")
-    return text
+    return unit.translate(_PUNCT_TRANS)
 
 
 def looks_like_terminal(text: str) -> bool:
-    for pattern in TERMINAL_MARKERS:
-        if re.search(pattern, text, flags=re.IGNORECASE):
-            return True
-    return False
+    return TERMINAL_RE.search(text) is not None
 
 
+@lru_cache(maxsize=64)
 def find_pdf_for_year(year: int, base_dir: Path) -> Tuple[Optional[Path], str]:
     annual_dir = base_dir / str(year) / "annual"
     if not annual_dir.exists():
@@ -169,21 +308,27 @@ def find_pdf_for_year(year: int, base_dir: Path) -> Tuple[Optional[Path], str]:
     if expected.exists():
         return expected, "exact"
 
-    candidates = list(annual_dir.glob("*.pdf"))
-    if not candidates:
+    # Single directory pass collecting both fallback candidate lists.
+    found_pdf = False
+    year_match: List[Path] = []
+    term_match: List[Path] = []
+    with os.scandir(annual_dir) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".pdf") or not entry.is_file():
+                continue
+            found_pdf = True
+            if "port terminals" in entry.name.lower():
+                term_match.append(Path(entry.path))
+                if str(year) in entry.name:
+                    year_match.append(Path(entry.path))
+    if not found_pdf:
         return None, "no_pdfs"
 
     # Fallback: any file containing "Port Terminals" and year
-    year_match = [
-        p
-        for p in candidates
-        if "port terminals" in p.name.lower() and str(year) in p.name
-    ]
     if len(year_match) == 1:
         return year_match[0], "fallback_year_match"
 
     # Fallback: any file containing "Port Terminals"
-    term_match = [p for p in candidates if "port terminals" in p.name.lower()]
     if len(term_match) == 1:
         return term_match[0], "fallback_single_terminals"
 
@@ -197,20 +342,20 @@ def parse_period_labels(lines: Iterable[str]) -> List[str]:
     max_status = 0
 
     for line in lines:
-        years = re.findall(r"20\d{2}", line)
+        years = _YEAR_RE.findall(line)
         if len(years) > max_years:
             max_years = len(years)
             year_line = line
 
-        statuses = re.findall(r"(Actual|Target|Budget|Forecast)", line, re.IGNORECASE)
+        statuses = _STATUS_RE.findall(line)
         if len(statuses) > max_status:
             max_status = len(statuses)
             status_line = line
 
-    years = [int(y) for y in re.findall(r"20\d{2}", year_line or "")]
+    years = [int(y) for y in _YEAR_RE.findall(year_line or "")]
     statuses = [
         s.capitalize()
-        for s in re.findall(r"(Actual|Target|Budget|Forecast)", status_line or "", re.IGNORECASE)
+        for s in _STATUS_RE.findall(status_line or "")
     ]
 
     if years and statuses and len(years) == len(statuses):
@@ -228,14 +373,19 @@ def parse_period_labels(lines: Iterable[str]) -> List[str]:
 
 
 def extract_values_from_line(line: str, num_periods: int) -> Tuple[Optional[str], List[str]]:
-    matches = list(VALUE_PATTERN.finditer(line))
-    if len(matches) < num_periods or num_periods == 0:
+    if num_periods == 0:
+        return None, []
+    found = VALUE_PATTERN.findall(line)
+    if len(found) < num_periods:
         return None, []
 
-    chosen = matches[-num_periods:]
-    start = chosen[0].start()
+    values = found[-num_periods:]
+    # Walk back from the end of the line. The gaps between matches hold no digits,
+    # so each bounded rindex lands on the match itself rather than an earlier repeat.
+    start = len(line)
+    for value in reversed(values):
+        start = line.rindex(value, 0, start)
     left_text = line[:start].strip()
-    values = [m.group(0) for m in chosen]
     return left_text, values
 
 
@@ -243,13 +393,13 @@ def parse_value(value: str) -> Optional[float]:
     if value is None:
         return None
     text = value.strip()
-    if text.lower() in {"n/a", "na", "-", "\u2013"}:
+    if text.lower() in _NA_VALUES:
         return None
-    text = text.replace(" ", "")
+    # Drop thousands spaces (including non-breaking) and percent signs in one pass.
+    text = text.translate(_VALUE_TRANS)
     # Use comma as decimal separator if no dot is present
     if "," in text and "." not in text:
         text = text.replace(",", ".")
-    text = text.replace("%", "")
     try:
         return float(text)
     except ValueError:
@@ -259,11 +409,11 @@ def parse_value(value: str) -> Optional[float]:
 def extract_unit(left_text: str) -> Tuple[str, Optional[str]]:
     cleaned = left_text.strip()
     cleaned = normalize_line(cleaned)
-    for unit in sorted(UNIT_PHRASES, key=len, reverse=True):
-        pattern = re.compile(rf"(?:^|\s){re.escape(unit)}$", re.IGNORECASE)
-        if pattern.search(cleaned):
-            name = pattern.sub("", cleaned).strip()
-            return name, normalize_unit_text(unit)
+    match = UNIT_ALT.search(cleaned)
+    if match:
+        name = cleaned[: match.start(1)].strip()
+        unit = UNIT_LOOKUP[match.group(1).lower()]
+        return name, normalize_unit_text(unit)
     return cleaned, None
 
 
@@ -274,22 +424,16 @@ def should_skip_line(line: str) -> bool:
     if stripped.isdigit():
         return True
     lower = stripped.lower()
-    if "transnet port terminals" in lower or lower.startswith("transnet port terminals"):
-        return True
-    if lower.startswith("transnet port terminals"):
-        return True
-    if lower.startswith("port terminals"):
+    if any(marker in lower for marker in _SKIP_CONTAINS):
         return True
-    if lower.startswith("contents"):
-        return True
-    if lower.startswith("operational performance continued"):
-        return True
-    return False
+    return lower.startswith(_SKIP_PREFIXES)
 
 
-def is_header_hint(line: str) -> bool:
-    norm = normalize_text(line)
-    return any(hint in norm for hint in HEADER_HINTS)
+def is_header_hint(line: str, norm: Optional[str] = None) -> bool:
+    # Callers that already normalized the line pass it in to avoid redoing the work.
+    if norm is None:
+        norm = normalize_text(line)
+    return _HEADER_RE.search(norm) is not None
 
 
 def build_rows_from_lines(
@@ -299,8 +443,12 @@ def build_rows_from_lines(
     year: int,
     source_pdf: str,
     page_number: int,
-) -> List[dict]:
-    rows: List[dict] = []
+    columns: Dict[str, list],
+) -> int:
+    # Rows are appended column-wise into `columns`; the return value is the number added.
+    # Lines must already be normalize_line()'d (page text is normalized once as a block).
+    targets = [columns[name] for name in COLUMNS]
+    added = 0
     num_periods = len(period_labels)
 
     for line in lines:
@@ -308,15 +456,14 @@ def build_rows_from_lines(
             continue
 
         norm = normalize_text(line)
-        if SECTION_HEADING in norm or is_header_hint(line):
+        if SECTION_HEADING in norm or is_header_hint(line, norm):
             continue
-        if any(stop in norm for stop in STOP_KEYWORDS):
+        if _STOP_RE.search(norm):
             break
 
-        if re.fullmatch(r"(20\d{2}\s+)+20\d{2}", norm):
+        if _YEAR_ONLY_LINE_RE.fullmatch(norm):
             continue
 
-        line = normalize_line(line)
         left_text, values = extract_values_from_line(line, num_periods)
         if not values:
             # Heading line
@@ -335,8 +482,10 @@ def build_rows_from_lines(
         descriptive, unit = extract_unit(left_text or "")
         descriptive = clean_kpi_name(descriptive)
 
-        bullet = bool(re.match(r"^[\u2013\u2014\-\u2022]+", descriptive))
-        descriptive = re.sub(r"^[\u2013\u2014\-\u2022]+\s*", "", descriptive).strip()
+        bullet = descriptive.startswith(_BULLET_PREFIXES)
+        if bullet:
+            descriptive = descriptive.lstrip(_BULLET_CHARS)
+        descriptive = descriptive.strip()
 
         kpi_name = state.current_kpi or descriptive
         terminal_or_scope = None
@@ -376,35 +525,36 @@ def build_rows_from_lines(
             confidence += 0.2
         confidence = min(confidence, 1.0)
 
-        rows.append(
-            {
-                "report_year": year,
-                "kpi_section": state.current_section,
-                "kpi_name": kpi_name,
-                "terminal_or_scope": terminal_or_scope,
-                "submetric": submetric,
-                "unit": unit,
-                "period_left_label": period_left[0],
-                "period_left_value": period_left[1],
-                "period_mid_label": period_mid[0],
-                "period_mid_value": period_mid[1],
-                "period_right_label": period_right[0],
-                "period_right_value": period_right[1],
-                "period_next_label": period_next[0],
-                "period_next_value": period_next[1],
-                "period_extra_labels": json.dumps([e[0] for e in extras]) if extras else None,
-                "period_extra_values": json.dumps([e[1] for e in extras]) if extras else None,
-                "source_pdf": source_pdf,
-                "source_page_start": page_number,
-                "source_page_end": page_number,
-                "extraction_confidence": round(confidence, 2),
-            }
+        row = (
+            year,
+            state.current_section,
+            kpi_name,
+            terminal_or_scope,
+            submetric,
+            unit,
+            period_left[0],
+            period_left[1],
+            period_mid[0],
+            period_mid[1],
+            period_right[0],
+            period_right[1],
+            period_next[0],
+            period_next[1],
+            [e[0] for e in extras] if extras else None,
+            [e[1] for e in extras] if extras else None,
+            source_pdf,
+            page_number,
+            page_number,
+            round(confidence, 2),
         )
+        for target, value in zip(targets, row):
+            target.append(value)
+        added += 1
 
-    return rows
+    return added
 
 
-def extract_kpis_from_pdf(pdf_path: Path, year: int) -> Tuple[List[dict], dict]:
+def extract_kpis_from_pdf(pdf_path: Path, year: int) -> Tuple[Dict[str, list], dict]:
     meta = {
         "year": year,
         "pdf": str(pdf_path),
@@ -414,19 +564,20 @@ def extract_kpis_from_pdf(pdf_path: Path, year: int) -> Tuple[List[dict], dict]:
         "warnings": [],
     }
 
-    rows: List[dict] = []
+    columns = new_columns()
     page_count = 0
-    with pdfplumber.open(pdf_path) as pdf:
-        page_count = len(pdf.pages)
+    with PdfDocument(pdf_path, resolve_pdf_backend()) as pdf:
+        page_count = len(pdf)
         start_page = None
-        for i, page in enumerate(pdf.pages):
-            text = normalize_line(page.extract_text() or "")
-            lower = text.lower()
+        for i in range(page_count):
+            if start_page is None and i >= MAX_HEADING_SCAN_PAGES:
+                break
+            lower = pdf.normalized_text(i).lower()
             if "contents" in lower and i <= 2:
                 continue
             has_heading = SECTION_HEADING in lower
-            has_header = any(hint in lower for hint in HEADER_HINTS)
-            year_count = len(re.findall(r"20\d{2}", lower))
+            has_header = _HEADER_RE.search(lower) is not None
+            year_count = len(_YEAR_RE.findall(lower))
             if has_heading and (has_header or year_count >= 3):
                 start_page = i
                 break
@@ -434,56 +585,61 @@ def extract_kpis_from_pdf(pdf_path: Path, year: int) -> Tuple[List[dict], dict]:
                 start_page = i
         if start_page is None:
             meta["warnings"].append("KPI header not found.")
-            return rows, meta
+            return columns, meta
 
         period_labels: List[str] = []
         state = ParseState()
 
-        for i in range(start_page, len(pdf.pages)):
-            page = pdf.pages[i]
-            text = normalize_line(page.extract_text() or "")
+        for i in range(start_page, page_count):
+            # Pages already read during discovery come from the document's text cache.
+            text = pdf.normalized_text(i)
             lower = text.lower()
 
             if i == start_page:
                 meta["start_page"] = i + 1
 
             # Stop conditions
-            if i > start_page and any(stop in lower for stop in STOP_KEYWORDS):
+            if i > start_page and _STOP_RE.search(lower):
                 meta["end_page"] = i
                 break
 
-            lines = text.splitlines()
-
-            # If header line exists, refresh period labels from this page
-            if any(hint in lower for hint in HEADER_HINTS) or not period_labels:
-                period_labels = parse_period_labels(lines)
-
-            # Start parsing after heading or header line
-            start_idx = 0
-            for idx, line in enumerate(lines):
-                if SECTION_HEADING in normalize_text(line):
-                    start_idx = idx + 1
-                if is_header_hint(line):
-                    start_idx = max(start_idx, idx + 1)
-            page_lines = lines[start_idx:]
-
-            page_rows = build_rows_from_lines(
-                page_lines,
-                period_labels,
-                state,
-                year,
-                str(pdf_path),
-                i + 1,
-            )
+            # Once rows have been found, a page without a single digit cannot continue the table,
+            # so skip parsing it. Before that, such a page may still set the section label.
+            page_rows = 0
+            if meta["end_page"] is None or _DIGIT_RE.search(text):
+                lines = text.splitlines()
+
+                # If header line exists, refresh period labels from this page
+                if _HEADER_RE.search(lower) or not period_labels:
+                    period_labels = parse_period_labels(lines)
+
+                # Start parsing after heading or header line
+                start_idx = 0
+                for idx, line in enumerate(lines):
+                    norm = normalize_text(line)
+                    if SECTION_HEADING in norm:
+                        start_idx = idx + 1
+                    if is_header_hint(line, norm):
+                        start_idx = max(start_idx, idx + 1)
+                page_lines = lines[start_idx:]
+
+                page_rows = build_rows_from_lines(
+                    page_lines,
+                    period_labels,
+                    state,
+                    year,
+                    str(pdf_path),
+                    i + 1,
+                    columns,
+                )
 
             if page_rows:
-                rows.extend(page_rows)
                 meta["end_page"] = i + 1
             elif i > start_page and meta["end_page"] is not None:
                 break
 
-    # Optional fallback: use camelot if pdfplumber yields no rows but we have a start page.
-    if not rows and camelot is not None and meta.get("start_page"):
+    # Optional fallback: use camelot if text extraction yields no rows but we have a start page.
+    if not column_row_count(columns) and camelot is not None and meta.get("start_page"):
         try:
             pages = ",".join(
                 str(p)
@@ -495,28 +651,89 @@ def extract_kpis_from_pdf(pdf_path: Path, year: int) -> Tuple[List[dict], dict]:
             for table in tables:
                 df_table = table.df
                 lines = [
-                    " ".join(str(v) for v in row if str(v).strip() != "")
+                    normalize_line(" ".join(str(v) for v in row if str(v).strip() != ""))
                     for row in df_table.values.tolist()
                 ]
-                rows.extend(
-                    build_rows_from_lines(
-                        lines,
-                        period_labels,
-                        ParseState(),
-                        year,
-                        str(pdf_path),
-                        meta["start_page"],
-                    )
+                build_rows_from_lines(
+                    lines,
+                    period_labels,
+                    ParseState(),
+                    year,
+                    str(pdf_path),
+                    meta["start_page"],
+                    columns,
                 )
-            if rows:
+            if column_row_count(columns):
                 meta["warnings"].append("Used camelot fallback extraction.")
         except Exception as exc:
             meta["warnings"].append(f"Camelot fallback failed: {exc}")
 
-    meta["rows_extracted"] = len(rows)
-    if not rows:
+    meta["rows_extracted"] = column_row_count(columns)
+    if not meta["rows_extracted"]:
         meta["warnings"].append("No KPI rows extracted.")
-    return rows, meta
+    return columns, meta
+
+
+def join_period_extras(items: Optional[list]) -> Optional[str]:
+    if not items:
+        return None
+    return EXTRA_SEPARATOR.join("" if item is None else str(item) for item in items)
+
+
+def split_period_extras(text: object, as_float: bool = False) -> Optional[list]:
+    if not isinstance(text, str):
+        return None
+    parts = text.split(EXTRA_SEPARATOR)
+    if as_float:
+        return [float(part) if part else None for part in parts]
+    return parts
+
+
+def category_sort_key(column: pd.Series) -> pd.Series:
+    # Sort text columns on integer category codes; missing values (code -1) still go last.
+    if column.dtype != object:
+        return column
+    codes = column.astype("category").cat.codes
+    return codes.where(codes >= 0, len(codes))
+
+
+def write_long_outputs(spill_path: Path, log: dict) -> None:
+    # The spill holds rows in extraction order; sort once here into the final outputs.
+    if pl is not None:
+        # nulls_last/maintain_order reproduce the pandas sort_values ordering.
+        schema = {
+            name: pl.Int64 if name in INT_COLUMNS else pl.Float64 if name in FLOAT_COLUMNS else pl.String
+            for name in COLUMNS
+        }
+        sorted_rows = pl.scan_csv(spill_path, schema=schema).sort(
+            SORT_COLUMNS, nulls_last=True, maintain_order=True
+        )
+        sorted_rows.sink_csv(OUTPUT_LONG_CSV)
+        sorted_rows.with_columns(
+            pl.col("period_extra_labels").str.split(EXTRA_SEPARATOR),
+            pl.col("period_extra_values")
+            .str.split(EXTRA_SEPARATOR)
+            .list.eval(pl.element().cast(pl.Float64, strict=False)),
+        ).sink_parquet(OUTPUT_LONG_PARQUET, compression="zstd")
+        return
+
+    dtypes = {
+        name: "int64" if name in INT_COLUMNS else "float64" if name in FLOAT_COLUMNS else object
+        for name in COLUMNS
+    }
+    # Only empty cells are missing; KPI text such as "NA" must stay a string.
+    df = pd.read_csv(spill_path, dtype=dtypes, keep_default_na=False, na_values=[""])
+    df.sort_values(by=SORT_COLUMNS, key=category_sort_key, inplace=True)
+    df.to_csv(OUTPUT_LONG_CSV, index=False)
+
+    df["period_extra_labels"] = df["period_extra_labels"].map(split_period_extras)
+    df["period_extra_values"] = df["period_extra_values"].map(
+        lambda text: split_period_extras(text, as_float=True)
+    )
+    try:
+        df.to_parquet(OUTPUT_LONG_PARQUET, index=False)
+    except Exception as exc:
+        log["warnings"].append(f"Parquet write skipped: {exc}")
 
 
 def main() -> int:
@@ -549,7 +766,7 @@ def main() -> int:
         "warnings": [],
     }
 
-    all_rows: List[dict] = []
+    pending: Dict[int, Path] = {}
 
     for year in YEARS:
         pdf_path, match_type = find_pdf_for_year(year, args.base_dir)
@@ -562,49 +779,67 @@ def main() -> int:
             "end_page": None,
             "warnings": [],
         }
+        log["years"][str(year)] = year_log
 
         if not pdf_path:
             year_log["warnings"].append("PDF not found.")
-            log["years"][str(year)] = year_log
             print(f"{year}: PDF not found ({match_type}).")
             continue
 
+        pending[year] = pdf_path
         print(f"{year}: Extracting from {pdf_path.name} ({match_type})")
-        rows, meta = extract_kpis_from_pdf(pdf_path, year)
-        all_rows.extend(rows)
-
-        year_log["rows_extracted"] = meta["rows_extracted"]
-        year_log["start_page"] = meta.get("start_page")
-        year_log["end_page"] = meta.get("end_page")
-        year_log["warnings"].extend(meta.get("warnings", []))
 
-        if meta.get("warnings"):
-            log["warnings"].extend(meta["warnings"])
-
-        log["years"][str(year)] = year_log
-        print(
-            f"  Rows: {year_log['rows_extracted']} | Pages: {year_log['start_page']}-{year_log['end_page']}"
-        )
+    # Each year's PDF is independent, so extract them in parallel. Results are consumed in
+    # YEARS order and spilled straight to disk, so all rows are never held in memory at once.
+    rows_total = 0
+    spill_path = OUTPUT_LONG_CSV.with_name(f"{OUTPUT_LONG_CSV.stem}.unsorted.csv")
+    with spill_path.open("w", newline="", encoding="utf-8") as spill:
+        writer = csv.writer(spill, lineterminator="\n")
+        writer.writerow(COLUMNS)
+        if pending:
+            max_workers = min(len(pending), os.cpu_count() or 1)
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    year: executor.submit(extract_kpis_from_pdf, pdf_path, year)
+                    for year, pdf_path in pending.items()
+                }
+                for year, future in futures.items():
+                    columns, meta = future.result()
+                    for name in EXTRA_COLUMNS:
+                        columns[name] = [join_period_extras(items) for items in columns[name]]
+                    writer.writerows(zip(*(columns[name] for name in COLUMNS)))
+                    rows_total += meta["rows_extracted"]
+
+                    year_log = log["years"][str(year)]
+                    year_log["rows_extracted"] = meta["rows_extracted"]
+                    year_log["start_page"] = meta.get("start_page")
+                    year_log["end_page"] = meta.get("end_page")
+                    year_log["warnings"].extend(meta.get("warnings", []))
+
+                    if meta.get("warnings"):
+                        log["warnings"].extend(meta["warnings"])
+
+                    print(
+                        f"{year}: Rows: {year_log['rows_extracted']} | Pages: {year_log['start_page']}-{year_log['end_page']}"
+                    )
 
-    if not all_rows:
+    if not rows_total:
+        spill_path.unlink()
         print("No KPI data extracted. See ingestion_log.json for details.")
         LOG_PATH.write_text(json.dumps(log, indent=2), encoding="utf-8")
         return 1
 
-    df = pd.DataFrame(all_rows)
-    df.sort_values(by=["report_year", "kpi_section", "kpi_name"], inplace=True)
-    df.to_csv(OUTPUT_LONG_CSV, index=False)
-
     try:
-        df.to_parquet(OUTPUT_LONG_PARQUET, index=False)
-    except Exception as exc:
-        log["warnings"].append(f"Parquet write skipped: {exc}")
+        write_long_outputs(spill_path, log)
+    finally:
+        # The spill file is scratch space; never leave it in the processed-data directory.
+        spill_path.unlink()
 
-    log["rows_total"] = int(len(df))
+    log["rows_total"] = rows_total
     LOG_PATH.write_text(json.dumps(log, indent=2), encoding="utf-8")
 
     print("\nSummary")
-    print(f"- Total rows: {len(df)}")
+    print(f"- Total rows: {rows_total}")
     print(f"- Output CSV: {OUTPUT_LONG_CSV}")
     print(f"- Output Parquet: {OUTPUT_LONG_PARQUET}")
     print(f"- Log: {LOG_PATH}")
@@ -20,12 +20,18 @@ from __future__ import annotations
 
 import argparse
 import json
+import os
 import re
+import shutil
 import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date, datetime
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 
 try:
@@ -33,6 +39,20 @@ try:
 except ImportError:  # pragma: no cover - import guard for runtime
     yaml = None
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - import guard for runtime
+    pa = None
+    pacsv = None
+    pq = None
+
+try:
+    import python_calamine
+except ImportError:  # pragma: no cover - import guard for runtime
+    python_calamine = None
+
 
 DEFAULT_CONFIG_PATH = Path("scripts/ingest/config_unit_volume.yml")
 DEFAULT_INPUT_DIR = Path("data/unit_volume_reports")
@@ -65,6 +85,30 @@ CANONICAL_COLUMNS = [
 
 CRITICAL_COLUMNS = ["facility_code", "category", "pol", "pod"]
 
+# Output dtypes; every other canonical column is written as text. Files are streamed out
+# one at a time, so each chunk is cast to these before it reaches the CSV/Parquet writers.
+OUTPUT_DTYPES = {
+    "report_period_start": "datetime64[s]",
+    "report_period_end": "datetime64[s]",
+    "type_length": "Int64",
+    "volume": "float64",
+}
+
+# Low-cardinality text columns held as categoricals on the frames handed back by the
+# workers; prepare_output_frame casts them back to text for the writers.
+CATEGORICAL_COLUMNS = [
+    "report_month",
+    "facility_code",
+    "category",
+    "pol_country_code",
+    "pod_country_code",
+    "iso_code",
+    "freight_kind",
+    "reefer_type",
+    "reqs_power",
+    "unit",
+]
+
 DEFAULT_HEADER_TOKENS = [
     "facility",
     "facility code",
@@ -146,26 +190,47 @@ DEFAULT_FILENAME_MONTH_REGEXES = [
         "pattern": (
             r"(?P<month_name>jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|"
             r"jun(?:e)?|jul(?:y)?|aug(?:ust)?|sep(?:tember)?|oct(?:ober)?|nov(?:ember)?|"
-            r"dec(?:ember)?)\\s*(?P<year>20\\d{2})"
+            r"dec(?:ember)?)\s*(?P<year>20\d{2})"
         )
     },
-    {"pattern": r"(?P<year>20\\d{2})[^0-9]?(?P<month_num>0?[1-9]|1[0-2])"},
-    {"pattern": r"(?P<year>20\\d{2})(?P<month_num>0[1-9]|1[0-2])"},
+    {"pattern": r"(?P<year>20\d{2})[^0-9]?(?P<month_num>1[0-2]|0?[1-9])"},
+    {"pattern": r"(?P<year>20\d{2})(?P<month_num>0[1-9]|1[0-2])"},
 ]
 
 DEFAULT_HEADER_DETECTION = {"max_scan_rows": 30, "min_match_count": 3}
 
-NULL_LIKE = {"", "null", "nan", "none"}
+NULL_LIKE = frozenset({"", "null", "nan", "none"})
+UNNAMED_PREFIX = "Unnamed"
+
+_HEADER_NON_ALNUM_RE = re.compile(r"[^a-z0-9]+")
+# ASCII fast path for normalize_header: every character outside [a-z0-9] becomes "_".
+_HEADER_ASCII_TRANS = str.maketrans(
+    {chr(i): "_" for i in range(128) if not (chr(i).isdigit() or "a" <= chr(i) <= "z")}
+)
+
+# Compiled once; parse_month_from_text and parse_type_length run per cell.
+_TYPE_LENGTH_RE = re.compile(r"\d+")
+_MONTH_NAME_RE = re.compile(r"(?P<month_name>[A-Za-z]{3,9})[^0-9]*(?P<year>\d{2,4})")
+_YEAR_MONTH_RE = re.compile(r"(?P<year>20\d{2})[^0-9]*(?P<month_num>1[0-2]|0?[1-9])")
+_MONTH_YEAR_RE = re.compile(r"(?P<month_num>1[0-2]|0?[1-9])[^0-9]*(?P<year>20\d{2})")
 
 
 def normalize_header(value: object) -> str:
     if value is None:
         return ""
-    text = str(value).strip().lower()
-    text = text.replace("\n", " ").replace("\t", " ")
-    text = re.sub(r"[^a-z0-9]+", "_", text)
-    text = re.sub(r"_+", "_", text).strip("_")
-    return text
+    # Cache on the string form so 1, 1.0 and True stay distinct keys.
+    return _normalize_header_text(str(value))
+
+
+@lru_cache(maxsize=8192)
+def _normalize_header_text(text: str) -> str:
+    text = text.strip().lower()
+    if text.isascii():
+        text = text.translate(_HEADER_ASCII_TRANS)
+    else:
+        text = _HEADER_NON_ALNUM_RE.sub("_", text)
+    # Collapse runs of "_" and trim them from both ends.
+    return "_".join(part for part in text.split("_") if part)
 
 
 def load_config(path: Path) -> dict:
@@ -180,15 +245,24 @@ def load_config(path: Path) -> dict:
 
 
 def list_excel_files(input_dir: Path) -> List[Path]:
-    patterns = ["*.xlsx", "*.xls", "*.xlsm"]
-    files: List[Path] = []
-    for pattern in patterns:
-        files.extend(input_dir.glob(pattern))
+    # One directory pass instead of a glob per extension.
+    extensions = {".xlsx", ".xls", ".xlsm"}
+    if not input_dir.is_dir():
+        return []
+    with os.scandir(input_dir) as entries:
+        files = [
+            Path(entry.path)
+            for entry in entries
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions
+        ]
     return sorted(files)
 
 
 def excel_engine_for(path: Path) -> Optional[str]:
     ext = path.suffix.lower()
+    # calamine (Rust) reads both xlsx and xls far faster than openpyxl/xlrd when installed.
+    if python_calamine is not None and ext in {".xlsx", ".xlsm", ".xltx", ".xltm", ".xls"}:
+        return "calamine"
     if ext in {".xlsx", ".xlsm", ".xltx", ".xltm"}:
         return "openpyxl"
     if ext == ".xls":
@@ -229,29 +303,50 @@ def find_header_row(
     min_match_count: int,
 ) -> Tuple[Optional[int], int, List[str]]:
     # We scan early rows to avoid title blocks and find the actual header row.
-    tokens = {normalize_header(token) for token in header_tokens}
-    for idx, row in preview.iterrows():
-        values = [
-            normalize_header(v) for v in row.tolist() if not pd.isna(v) and str(v).strip()
-        ]
-        matched = {v for v in values if v in tokens}
+    tokens = frozenset(normalize_header(token) for token in header_tokens)
+    # Work on the raw numpy arrays; iterrows() would build a Series per row.
+    cells = preview.to_numpy(dtype=object)
+    present = preview.notna().to_numpy()
+    for pos, (row, row_present) in enumerate(zip(cells, present)):
+        matched = {
+            normalize_header(v) for v, ok in zip(row, row_present) if ok and str(v).strip()
+        }
+        matched &= tokens
         if len(matched) >= min_match_count:
-            return idx, len(matched), sorted(matched)
+            return preview.index[pos], len(matched), sorted(matched)
     return None, 0, []
 
 
+def read_sheet_preview(xl: pd.ExcelFile, sheet: str, max_rows: int) -> pd.DataFrame:
+    # For openpyxl, pull the first rows straight from the worksheet iterator; row positions
+    # match what xl.parse(header=...) uses, without pandas' per-cell conversion layer.
+    if xl.engine == "openpyxl":
+        rows = xl.book[sheet].iter_rows(max_row=max_rows, values_only=True)
+        return pd.DataFrame(list(rows))
+    return xl.parse(sheet, header=None, nrows=max_rows)
+
+
+def header_positions(header: pd.Series) -> List[int]:
+    # Columns with a blank header cell would only come back as "Unnamed: n" and be
+    # dropped, so keep them out of the full parse altogether.
+    return [
+        pos
+        for pos, value in enumerate(header)
+        if not pd.isna(value) and str(value) != ""
+    ]
+
+
 def normalize_columns(
     df: pd.DataFrame,
-    column_synonyms: Dict[str, List[str]],
+    lookup: Dict[str, str],
     warnings: List[str],
     keep_unmapped: bool = False,
 ) -> Tuple[pd.DataFrame, Dict[str, str]]:
-    normalized = {col: normalize_header(col) for col in df.columns}
-    df = df.rename(columns=normalized)
+    # lookup comes from build_synonym_lookup(), built once per run.
+    normalized = [normalize_header(col) for col in df.columns]
 
-    lookup = build_synonym_lookup(column_synonyms)
     col_map: Dict[str, str] = {}
-    for col in df.columns:
+    for col in normalized:
         canonical = lookup.get(col)
         if not canonical:
             continue
@@ -262,46 +357,31 @@ def normalize_columns(
             continue
         col_map[canonical] = col
 
-    df = df.rename(columns={src: dest for dest, src in col_map.items()})
-
-    for canonical in CANONICAL_COLUMNS:
-        if canonical not in df.columns:
-            df[canonical] = pd.NA
+    # Relabel in one pass: mapped columns get their canonical name, others keep the normalized one.
+    sources = {src: dest for dest, src in col_map.items()}
+    df = df.set_axis([sources.get(col, col) for col in normalized], axis=1)
 
+    columns = list(CANONICAL_COLUMNS)
     if keep_unmapped:
-        extras = [col for col in df.columns if col not in CANONICAL_COLUMNS]
-        df = df[CANONICAL_COLUMNS + extras]
-    else:
-        df = df[CANONICAL_COLUMNS]
+        columns += [col for col in df.columns if col not in CANONICAL_COLUMNS]
+    # One reindex selects/orders the columns and adds any missing canonical ones as NA.
+    df = df.reindex(columns=columns, fill_value=pd.NA)
 
     return df, col_map
 
 
 def clean_object_series(series: pd.Series) -> pd.Series:
-    def _clean(val: object) -> object:
-        if val is None or (isinstance(val, float) and pd.isna(val)):
-            return pd.NA
-        text = str(val).strip()
-        if not text:
-            return pd.NA
-        if text.lower() in NULL_LIKE:
-            return pd.NA
-        return text
-
-    return series.map(_clean)
+    # Vectorized strip; empty and null-like strings ("nan", "None", ...) become NA.
+    text = series.astype("string").str.strip()
+    return text.mask(text.isna() | text.str.lower().isin(NULL_LIKE), pd.NA)
 
 
 def normalize_category(series: pd.Series, category_map: Dict[str, str]) -> pd.Series:
-    def _norm(val: object) -> object:
-        if val is None or (isinstance(val, float) and pd.isna(val)):
-            return pd.NA
-        text = str(val).strip()
-        if not text or text.lower() in NULL_LIKE:
-            return pd.NA
-        text_lower = text.lower()
-        return category_map.get(text_lower, text.upper())
-
-    return series.map(_norm)
+    # Vectorized: mapped values win, anything unmapped is upper-cased, null-likes become NA.
+    text = series.astype("string").str.strip()
+    text_lower = text.str.lower()
+    normalized = text_lower.map(category_map).fillna(text.str.upper())
+    return normalized.mask(text_lower.isna() | text_lower.isin(NULL_LIKE), pd.NA)
 
 
 def parse_type_length(val: object) -> object:
@@ -310,12 +390,20 @@ def parse_type_length(val: object) -> object:
     if isinstance(val, (int, float)) and not pd.isna(val):
         return int(val)
     text = str(val)
-    match = re.search(r"\\d+", text)
+    match = _TYPE_LENGTH_RE.search(text)
     if match:
         return int(match.group())
     return pd.NA
 
 
+def parse_type_length_series(series: pd.Series) -> pd.Series:
+    # Vectorized parse_type_length: numbers are truncated, text keeps its first run of digits.
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return pd.Series(np.trunc(series.astype("float64")), index=series.index).astype("Int64")
+    digits = series.astype("string").str.extract(f"({_TYPE_LENGTH_RE.pattern})", expand=False)
+    return pd.to_numeric(digits, errors="coerce").astype("Int64")
+
+
 def parse_month_from_text(value: object, month_name_map: Dict[str, int]) -> Optional[str]:
     if value is None or (isinstance(value, float) and pd.isna(value)):
         return None
@@ -325,10 +413,7 @@ def parse_month_from_text(value: object, month_name_map: Dict[str, int]) -> Opti
     if not text or text.lower() in NULL_LIKE:
         return None
 
-    match = re.search(
-        r"(?P<month_name>[A-Za-z]{3,9})[^0-9]*(?P<year>\\d{2,4})",
-        text,
-    )
+    match = _MONTH_NAME_RE.search(text)
     if match:
         month_name = match.group("month_name").lower()
         month = month_name_map.get(month_name)
@@ -338,13 +423,13 @@ def parse_month_from_text(value: object, month_name_map: Dict[str, int]) -> Opti
         if month:
             return f"{year:04d}-{month:02d}"
 
-    match = re.search(r"(?P<year>20\\d{2})[^0-9]*(?P<month_num>0?[1-9]|1[0-2])", text)
+    match = _YEAR_MONTH_RE.search(text)
     if match:
         year = int(match.group("year"))
         month = int(match.group("month_num"))
         return f"{year:04d}-{month:02d}"
 
-    match = re.search(r"(?P<month_num>0?[1-9]|1[0-2])[^0-9]*(?P<year>20\\d{2})", text)
+    match = _MONTH_YEAR_RE.search(text)
     if match:
         year = int(match.group("year"))
         month = int(match.group("month_num"))
@@ -353,13 +438,18 @@ def parse_month_from_text(value: object, month_name_map: Dict[str, int]) -> Opti
     return None
 
 
+def compile_month_patterns(patterns: List[dict]) -> List[Tuple[re.Pattern, dict]]:
+    return [(re.compile(pattern["pattern"], re.IGNORECASE), pattern) for pattern in patterns]
+
+
 def parse_report_month_from_patterns(
     text: str,
-    patterns: List[dict],
+    patterns: List[Tuple[re.Pattern, dict]],
     month_name_map: Dict[str, int],
 ) -> Optional[str]:
-    for pattern in patterns:
-        match = re.search(pattern["pattern"], text, re.IGNORECASE)
+    # Patterns come precompiled from compile_month_patterns().
+    for regex, _pattern in patterns:
+        match = regex.search(text)
         if not match:
             continue
         year = match.groupdict().get("year")
@@ -381,18 +471,23 @@ def infer_report_month(
     file_path: Path,
     df: pd.DataFrame,
     config: Optional[dict] = None,
+    month_patterns: Optional[List[Tuple[re.Pattern, dict]]] = None,
 ) -> Tuple[Optional[str], str]:
     # Prefer month inference from the Excel date column to avoid guesswork from filenames.
     config = config or {}
     month_name_map = config.get("month_name_map", DEFAULT_MONTH_NAME_MAP)
     date_values = df["date_raw"] if "date_raw" in df.columns else pd.Series([], dtype=object)
-    months: List[str] = []
-    for val in date_values:
+    # A date column holds a handful of distinct labels, so parse each once and weight
+    # it by its row count.
+    month_counts: Counter = Counter()
+    for val, count in date_values.value_counts().items():
         month = parse_month_from_text(val, month_name_map)
         if month:
-            months.append(month)
-    if months:
-        report_month = pd.Series(months).mode().iloc[0]
+            month_counts[month] += int(count)
+    if month_counts:
+        # Ties go to the earliest month, as pd.Series.mode() did.
+        top = max(month_counts.values())
+        report_month = min(month for month, count in month_counts.items() if count == top)
         return report_month, "date_raw"
 
     filename = file_path.stem
@@ -400,15 +495,20 @@ def infer_report_month(
     if report_month:
         return report_month, "filename"
 
-    patterns = config.get("filename_month_regexes", DEFAULT_FILENAME_MONTH_REGEXES)
-    report_month = parse_report_month_from_patterns(filename, patterns, month_name_map)
+    if month_patterns is None:
+        month_patterns = compile_month_patterns(
+            config.get("filename_month_regexes", DEFAULT_FILENAME_MONTH_REGEXES)
+        )
+    report_month = parse_report_month_from_patterns(filename, month_patterns, month_name_map)
     if report_month:
         return report_month, "filename"
 
     return None, "unknown"
 
 
+@lru_cache(maxsize=256)
 def build_report_periods(report_month: Optional[str]) -> Tuple[object, object]:
+    # Called once per file with one of a few dozen months; cache the datetime parsing.
     if not report_month:
         return pd.NA, pd.NA
     start = pd.to_datetime(f"{report_month}-01", errors="coerce")
@@ -454,8 +554,9 @@ def apply_volume_and_unit(
 def ingest_one_excel(
     path: Path,
     config: dict,
-    column_synonyms: Dict[str, List[str]],
+    column_lookup: Dict[str, str],
     header_tokens: List[str],
+    month_patterns: Optional[List[Tuple[re.Pattern, dict]]] = None,
 ) -> Tuple[Optional[pd.DataFrame], dict]:
     file_log = {
         "file": path.name,
@@ -477,8 +578,10 @@ def ingest_one_excel(
     }
 
     engine = excel_engine_for(path)
+    # openpyxl streams rows in read-only mode instead of building the full cell tree.
+    engine_kwargs = {"read_only": True, "data_only": True} if engine == "openpyxl" else None
     try:
-        xl = pd.ExcelFile(path, engine=engine)
+        xl = pd.ExcelFile(path, engine=engine, engine_kwargs=engine_kwargs)
     except Exception as exc:
         file_log["status"] = "error"
         file_log["error"] = f"Failed to open: {exc}"
@@ -488,74 +591,79 @@ def ingest_one_excel(
     max_scan_rows = int(header_cfg.get("max_scan_rows", DEFAULT_HEADER_DETECTION["max_scan_rows"]))
     min_match_count = int(header_cfg.get("min_match_count", DEFAULT_HEADER_DETECTION["min_match_count"]))
 
-    selected_sheet = None
-    header_row = None
-    matched_fields: List[str] = []
-
-    for sheet in xl.sheet_names:
-        try:
-            preview = xl.parse(sheet, header=None, nrows=max_scan_rows)
-        except Exception as exc:
+    # Read-only workbooks keep the file open until closed, so release it once parsed.
+    with xl:
+        selected_sheet = None
+        header_row = None
+        usecols: Optional[List[int]] = None
+        matched_fields: List[str] = []
+
+        for sheet in xl.sheet_names:
+            try:
+                preview = read_sheet_preview(xl, sheet, max_scan_rows)
+            except Exception as exc:
+                file_log["sheet_logs"].append(
+                    {"sheet": sheet, "status": "error", "error": str(exc)}
+                )
+                continue
+            row_idx, match_count, matched_tokens = find_header_row(
+                preview, header_tokens, min_match_count
+            )
             file_log["sheet_logs"].append(
-                {"sheet": sheet, "status": "error", "error": str(exc)}
+                {
+                    "sheet": sheet,
+                    "status": "scanned",
+                    "header_row": row_idx,
+                    "match_count": match_count,
+                    "matched_fields": matched_tokens,
+                }
             )
-            continue
-        row_idx, match_count, matched_tokens = find_header_row(
-            preview, header_tokens, min_match_count
-        )
-        file_log["sheet_logs"].append(
-            {
-                "sheet": sheet,
-                "status": "scanned",
-                "header_row": row_idx,
-                "match_count": match_count,
-                "matched_fields": matched_tokens,
-            }
-        )
-        if row_idx is not None:
-            selected_sheet = sheet
-            header_row = row_idx
-            matched_fields = matched_tokens
-            break
-
-    if selected_sheet is None and xl.sheet_names:
-        # Fall back to the first sheet if detection fails, but flag it for review.
-        selected_sheet = xl.sheet_names[0]
-        header_row = 0
-        file_log["warnings"].append("Header tokens not found; defaulted to first row.")
-
-    if selected_sheet is None or header_row is None:
-        file_log["status"] = "skipped"
-        file_log["error"] = "No suitable sheet/header found."
-        return None, file_log
+            if row_idx is not None:
+                selected_sheet = sheet
+                header_row = row_idx
+                usecols = header_positions(preview.loc[row_idx])
+                matched_fields = matched_tokens
+                break
+
+        if selected_sheet is None and xl.sheet_names:
+            # Fall back to the first sheet if detection fails, but flag it for review.
+            selected_sheet = xl.sheet_names[0]
+            header_row = 0
+            file_log["warnings"].append("Header tokens not found; defaulted to first row.")
+
+        if selected_sheet is None or header_row is None:
+            file_log["status"] = "skipped"
+            file_log["error"] = "No suitable sheet/header found."
+            return None, file_log
 
-    try:
-        df_raw = xl.parse(selected_sheet, header=header_row)
-    except Exception as exc:
-        file_log["status"] = "error"
-        file_log["error"] = f"Failed to parse sheet {selected_sheet}: {exc}"
-        return None, file_log
+        try:
+            df_raw = xl.parse(selected_sheet, header=header_row, usecols=usecols)
+        except Exception as exc:
+            file_log["status"] = "error"
+            file_log["error"] = f"Failed to parse sheet {selected_sheet}: {exc}"
+            return None, file_log
 
-    df_raw = df_raw.loc[:, ~df_raw.columns.astype(str).str.match(r"^Unnamed")]
+    # Drop pandas' placeholder names for blank header cells (a literal prefix, no regex needed).
+    keep = [not str(col).startswith(UNNAMED_PREFIX) for col in df_raw.columns]
+    df_raw = df_raw.loc[:, keep]
 
     warnings: List[str] = []
     keep_unmapped = bool(config.get("options", {}).get("keep_unmapped_columns", False))
     df, column_sources = normalize_columns(
-        df_raw, column_synonyms, warnings, keep_unmapped=keep_unmapped
+        df_raw, column_lookup, warnings, keep_unmapped=keep_unmapped
     )
 
-    for col in df.columns:
-        if df[col].dtype == object:
-            df[col] = clean_object_series(df[col])
+    for col in df.select_dtypes(include="object").columns:
+        df[col] = clean_object_series(df[col])
 
     category_map = config.get("category_value_map", DEFAULT_CATEGORY_VALUE_MAP)
     if "category" in df.columns:
         df["category"] = normalize_category(df["category"], category_map)
 
     if "type_length" in df.columns:
-        df["type_length"] = df["type_length"].map(parse_type_length)
+        df["type_length"] = parse_type_length_series(df["type_length"])
 
-    report_month, report_month_source = infer_report_month(path, df, config)
+    report_month, report_month_source = infer_report_month(path, df, config, month_patterns)
     report_start, report_end = build_report_periods(report_month)
     df["report_month"] = report_month
     df["report_period_start"] = report_start
@@ -565,8 +673,11 @@ def ingest_one_excel(
     volume_source_name = column_sources.get("volume")
     apply_volume_and_unit(df, volume_source_name, config, warnings)
 
+    # Columns with no source in the file are all-NA by construction; only scan mapped ones.
     missing_critical = [
-        col for col in CRITICAL_COLUMNS if col not in df.columns or df[col].isna().all()
+        col
+        for col in CRITICAL_COLUMNS
+        if col not in column_sources or df[col].isna().all()
     ]
 
     file_log.update(
@@ -588,13 +699,19 @@ def ingest_one_excel(
         }
     )
 
+    for col in CATEGORICAL_COLUMNS:
+        df[col] = df[col].astype("category")
+
     return df, file_log
 
 
 def ingest_all_excels(
     input_dir: Path,
     config: dict,
+    on_frame: Optional[Callable[[pd.DataFrame], None]] = None,
 ) -> Tuple[Optional[pd.DataFrame], dict]:
+    # With on_frame, each processed file is handed over as it arrives and nothing is
+    # combined in memory (the returned DataFrame is then None).
     files = list_excel_files(input_dir)
     log = {
         "run_timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
@@ -611,43 +728,66 @@ def ingest_all_excels(
     if not files:
         return None, log
 
-    column_synonyms = build_column_synonyms(config)
+    # Header synonyms are normalized once per run and shared by every file.
+    column_lookup = build_synonym_lookup(build_column_synonyms(config))
     header_tokens = config.get("header_tokens", DEFAULT_HEADER_TOKENS)
+    # Compile the filename month patterns once per run rather than once per file.
+    month_patterns = compile_month_patterns(
+        config.get("filename_month_regexes", DEFAULT_FILENAME_MONTH_REGEXES)
+    )
 
     combined: List[pd.DataFrame] = []
     months: List[str] = []
 
-    for path in files:
-        df, file_log = ingest_one_excel(path, config, column_synonyms, header_tokens)
-        if df is None:
-            log["files_skipped"] += 1
-            log["errors"].append(file_log.get("error"))
+    # Files are independent, so parse them in parallel; results are handled in file order.
+    ingest = partial(
+        ingest_one_excel,
+        config=config,
+        column_lookup=column_lookup,
+        header_tokens=header_tokens,
+        month_patterns=month_patterns,
+    )
+    max_workers = min(len(files), os.cpu_count() or 1)
+    # A single file (or core) is parsed in-process; a pool would only add spawn/pickle cost.
+    executor = ProcessPoolExecutor(max_workers=max_workers) if max_workers > 1 else None
+    try:
+        results = map(ingest, files) if executor is None else executor.map(ingest, files)
+        for path, (df, file_log) in zip(files, results):
+            if df is None:
+                log["files_skipped"] += 1
+                log["errors"].append(file_log.get("error"))
+                log["file_logs"].append(file_log)
+                print(f"SKIP: {path.name} | {file_log.get('error')}")
+                continue
+
+            log["files_processed"] += 1
             log["file_logs"].append(file_log)
-            print(f"SKIP: {path.name} | {file_log.get('error')}")
-            continue
+            if file_log.get("report_month"):
+                months.append(file_log["report_month"])
 
-        log["files_processed"] += 1
-        log["file_logs"].append(file_log)
-        if file_log.get("report_month"):
-            months.append(file_log["report_month"])
-
-        combined.append(df)
-
-        missing = ", ".join(file_log.get("missing_critical_columns") or []) or "none"
-        print(
-            "Quality: {file} | rows={rows} | report_month={month} ({source}) | "
-            "facility_codes={fac} | missing_critical={missing}".format(
-                file=path.name,
-                rows=file_log["rows"],
-                month=file_log.get("report_month") or "UNKNOWN",
-                source=file_log.get("report_month_source") or "unknown",
-                fac=file_log.get("unique_facility_codes"),
-                missing=missing,
+            if on_frame is None:
+                combined.append(df)
+            else:
+                on_frame(df)
+
+            missing = ", ".join(file_log.get("missing_critical_columns") or []) or "none"
+            print(
+                "Quality: {file} | rows={rows} | report_month={month} ({source}) | "
+                "facility_codes={fac} | missing_critical={missing}".format(
+                    file=path.name,
+                    rows=file_log["rows"],
+                    month=file_log.get("report_month") or "UNKNOWN",
+                    source=file_log.get("report_month_source") or "unknown",
+                    fac=file_log.get("unique_facility_codes"),
+                    missing=missing,
+                )
             )
-        )
 
-        for warn in file_log.get("warnings", []):
-            print(f"  WARN: {warn}")
+            for warn in file_log.get("warnings", []):
+                print(f"  WARN: {warn}")
+    finally:
+        if executor is not None:
+            executor.shutdown()
 
     log["months_covered"] = sorted(set(months))
     if combined:
@@ -657,6 +797,108 @@ def ingest_all_excels(
     return df_all, log
 
 
+def prepare_output_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # Arrow-backed strings are compact and convert to Parquet without a copy.
+    text_dtype = "string[pyarrow]" if pa is not None else "string"
+    dtypes = {col: OUTPUT_DTYPES.get(col, text_dtype) for col in CANONICAL_COLUMNS}
+    return df[CANONICAL_COLUMNS].astype(dtypes)
+
+
+def csv_ready_table(table: "pa.Table") -> "pa.Table":
+    # Arrow prints timestamps with a time part; write the period dates as plain dates.
+    for i, field in enumerate(table.schema):
+        if pa.types.is_timestamp(field.type):
+            table = table.set_column(i, field.name, table.column(i).cast(pa.date32()))
+    return table
+
+
+def write_csv(df: pd.DataFrame, path: Path) -> None:
+    # Arrow's C++ CSV writer is much faster than DataFrame.to_csv; pandas is the fallback.
+    if pacsv is None:
+        df.to_csv(path, index=False, lineterminator="\n")
+        return
+    table = csv_ready_table(pa.Table.from_pandas(df, preserve_index=False))
+    pacsv.write_csv(table, path, write_options=pacsv.WriteOptions(quoting_style="needed"))
+
+
+class LongOutputWriter:
+    """Streams each ingested file to the long CSV (and optional Parquet) as it arrives."""
+
+    def __init__(
+        self,
+        csv_path: Path,
+        parquet_path: Optional[Path] = None,
+        keep_columns: Optional[List[str]] = None,
+    ) -> None:
+        self.csv_path = csv_path
+        self.parquet_path = parquet_path
+        # Only these columns are kept in memory (for the wide pivot); None keeps nothing.
+        self.keep_columns = keep_columns
+        self.kept: List[pd.DataFrame] = []
+        self.rows = 0
+        self.missing_report_months = 0
+        self.has_facility_code = False
+        self.warnings: List[str] = []
+        self._csv = None
+        self._parquet = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        df = prepare_output_frame(df)
+        # One Arrow table per chunk feeds both the CSV and the Parquet writer.
+        table = pa.Table.from_pandas(df, preserve_index=False) if pa is not None else None
+
+        self._write_csv(df, table)
+        if self.parquet_path is not None:
+            self._write_parquet(table)
+        if self.keep_columns is not None:
+            self.kept.append(df[[col for col in self.keep_columns if col in df.columns]])
+
+        self.rows += len(df)
+        self.missing_report_months += int(df["report_month"].isna().sum())
+        self.has_facility_code = self.has_facility_code or bool(df["facility_code"].notna().any())
+
+    def _write_csv(self, df: pd.DataFrame, table: Optional["pa.Table"]) -> None:
+        if table is None:
+            if self._csv is None:
+                self._csv = self.csv_path.open("w", newline="", encoding="utf-8")
+                df.to_csv(self._csv, index=False, lineterminator="\n")
+            else:
+                df.to_csv(self._csv, index=False, header=False, lineterminator="\n")
+            return
+        table = csv_ready_table(table)
+        if self._csv is None:
+            self._csv = pacsv.CSVWriter(
+                self.csv_path,
+                table.schema,
+                write_options=pacsv.WriteOptions(quoting_style="needed"),
+            )
+        self._csv.write_table(table)
+
+    def _write_parquet(self, table: Optional["pa.Table"]) -> None:
+        try:
+            if table is None:
+                raise RuntimeError("pyarrow is required. Install with: python -m pip install pyarrow")
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.parquet_path, table.schema)
+            self._parquet.write_table(table)
+        except Exception as exc:
+            # Give up on Parquet for this run and drop any partial file; the CSV carries on.
+            self.warnings.append(f"Parquet write skipped: {exc}")
+            if self._parquet is not None:
+                self._parquet.close()
+                self._parquet = None
+            self.parquet_path.unlink(missing_ok=True)
+            self.parquet_path = None
+
+    def close(self) -> None:
+        if self._csv is not None:
+            self._csv.close()
+        if self._parquet is not None:
+            self._parquet.close()
+
+
 def write_data_dictionary(path: Path, columns: List[str]) -> None:
     column_descriptions = {
         "report_month": "Report month inferred from date_raw or filename (YYYY-MM).",
@@ -683,22 +925,18 @@ def write_data_dictionary(path: Path, columns: List[str]) -> None:
         "reqs_power": "Requires power flag from report.",
     }
 
-    lines = []
-    lines.append("# Unit Volume Data Dictionary\n")
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    lines.append("\n## Columns\n")
-    for col in columns:
-        desc = column_descriptions.get(col, "No description available.")
-        lines.append(f"- {col}: {desc}\n")
-    lines.append("\n## Notes\n")
-    lines.append(
-        "- Each row represents one unit when no explicit volume column is present.\n"
-    )
-    lines.append(
-        "- report_month is inferred from date_raw when available to avoid filename drift.\n"
-    )
-
-    path.write_text("".join(lines), encoding="utf-8")
+    lines = [
+        "# Unit Volume Data Dictionary",
+        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        "",
+        "## Columns",
+        *(f"- {col}: {column_descriptions.get(col, 'No description available.')}" for col in columns),
+        "",
+        "## Notes",
+        "- Each row represents one unit when no explicit volume column is present.",
+        "- report_month is inferred from date_raw when available to avoid filename drift.",
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
 
 
 def main() -> int:
@@ -749,45 +987,54 @@ def main() -> int:
     output_dir = args.output_dir or Path(config.get("output_dir", output_path.parent))
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    df_all, log = ingest_all_excels(input_dir, config)
-    if df_all is None or df_all.empty:
-        print(f"No data processed from {input_dir}.")
-        return 1
-
-    df_all = df_all[CANONICAL_COLUMNS]
-    df_all.to_csv(output_path, index=False)
-
     # Optional extra outputs for backward compatibility.
     output_cfg = config.get("output", {})
+    wide_cfg = config.get("wide_output", {})
+    output_parquet = None
+    wide_columns = None
     if output_cfg:
-        output_long = output_dir / output_cfg.get("long_filename", "unit_volume_long.csv")
-        df_all.to_csv(output_long, index=False)
-
         output_parquet = output_dir / output_cfg.get("parquet_filename", "unit_volume.parquet")
-        try:
-            df_all.to_parquet(output_parquet, index=False)
-        except Exception as exc:
-            msg = f"Parquet write skipped: {exc}"
-            print(f"WARN: {msg}")
-            log["warnings"].append(msg)
-
-        wide_cfg = config.get("wide_output", {})
         if wide_cfg.get("enabled", True):
             group_by = wide_cfg.get("group_by", ["facility_code", "category", "unit"])
-            group_by = [c for c in group_by if c in df_all.columns and df_all[c].notna().any()]
-            if "report_month" in df_all.columns and group_by:
+            value_column = wide_cfg.get("value_column", "volume")
+            wide_columns = list(dict.fromkeys(group_by + ["report_month", value_column]))
+
+    # Rows are written file by file; only the wide-pivot columns are kept in memory.
+    writer = LongOutputWriter(output_path, output_parquet, wide_columns)
+    try:
+        _, log = ingest_all_excels(input_dir, config, on_frame=writer.write)
+    finally:
+        writer.close()
+    if not writer.rows:
+        print(f"No data processed from {input_dir}.")
+        return 1
+
+    for msg in writer.warnings:
+        print(f"WARN: {msg}")
+        log["warnings"].append(msg)
+
+    if output_cfg:
+        output_long = output_dir / output_cfg.get("long_filename", "unit_volume_long.csv")
+        if output_long.resolve() != output_path.resolve():
+            shutil.copyfile(output_path, output_long)
+
+        if wide_columns is not None:
+            df_wide = pd.concat(writer.kept, ignore_index=True)
+            group_by = [c for c in group_by if c in df_wide.columns and df_wide[c].notna().any()]
+            if "report_month" in df_wide.columns and group_by:
+                # Categorical keys let the grouped sum work on integer codes; observed=True
+                # keeps only real combinations and dropna=False keeps rows with blank keys.
+                df_wide = df_wide.astype({col: "category" for col in group_by})
                 wide = (
-                    df_all.pivot_table(
-                        index=group_by,
-                        columns="report_month",
-                        values=wide_cfg.get("value_column", "volume"),
-                        aggfunc="sum",
-                        fill_value=0,
-                    )
+                    df_wide.groupby(group_by + ["report_month"], observed=True, dropna=False)[
+                        value_column
+                    ]
+                    .sum()
+                    .unstack("report_month", fill_value=0)
                     .reset_index()
                 )
                 output_wide = output_dir / output_cfg.get("wide_filename", "unit_volume_wide.csv")
-                wide.to_csv(output_wide, index=False)
+                write_csv(wide, output_wide)
             else:
                 msg = "Wide output skipped: missing report_month or group_by columns."
                 print(f"WARN: {msg}")
@@ -796,16 +1043,16 @@ def main() -> int:
     data_dict_path = output_dir / "data_dictionary.md"
     write_data_dictionary(data_dict_path, CANONICAL_COLUMNS)
 
-    log["row_count"] = int(len(df_all))
+    log["row_count"] = writer.rows
     log_path = output_dir / "ingestion_log.json"
     log_path.write_text(json.dumps(log, indent=2), encoding="utf-8")
 
     # Self-checks to prevent silent month/facility loss.
-    missing_months = df_all["report_month"].isna().sum()
+    missing_months = writer.missing_report_months
     if missing_months:
         print(f"ERROR: report_month is null for {missing_months} rows.")
         return 2
-    if "facility_code" not in df_all.columns or df_all["facility_code"].isna().all():
+    if not writer.has_facility_code:
         print("ERROR: facility_code is missing or entirely null.")
         return 2
 
@@ -43,12 +43,19 @@ def normalize_text(text: str) -> str:
 
 def pdf_contains_terms(pdf_path: Path, terms) -> dict:
     results = {term: False for term in terms}
+    # Only terms not yet seen are checked, so each page scan shrinks as terms are found.
+    pending = list(results)
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
             text = normalize_text(page.extract_text() or "")
-            for term in terms:
-                if term in text:
-                    results[term] = True
+            found = [term for term in pending if term in text]
+            for term in found:
+                results[term] = True
+                pending.remove(term)
+            # Drop the page's parsed layout objects; long reports otherwise keep them all.
+            page.flush_cache()
+            if not pending:
+                break
     return results
 
 
@@ -57,8 +64,8 @@ def main() -> int:
     pdf_path, match_type = find_pdf_for_year(year, BASE_DIR)
     print(f"Running smoke test for {year} ({match_type}) -> {pdf_path}")
 
-    rows, meta = extract_kpis_from_pdf(pdf_path, year)
-    df = pd.DataFrame(rows)
+    columns, meta = extract_kpis_from_pdf(pdf_path, year)
+    df = pd.DataFrame(columns)
 
     print(f"Rows extracted: {len(df)}")
     print(df.head(10))
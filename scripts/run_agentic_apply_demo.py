@@ -20,9 +20,10 @@
 # Key artifacts under the output directory (`--out`):
 # - `decision.json` (diagnostics + agent decision + guardrails)
 # - `overrides.json` (applied config changes; only if we actually apply)
-# - `comparison.json`, `comparison.csv` (baseline vs after KPIs; only if re-run happens)
+# - `comparison.json`, `comparison.csv`, `comparison.feather` (baseline vs after KPIs; only if re-run happens;
+#   the Feather file needs pyarrow)
 # - `agentic_summary.md` (scroll-friendly demo summary)
-# - `baseline/` and `after/` runs with `metadata.json`, `kpis.csv`, plots, `run.log`, etc.
+# - `baseline/` and `after/` runs with `metadata.json`, `kpis.csv`/`kpis.feather`, plots, `run.log`, etc.
 #
 # Guardrails (intentional bounds for a demo):
 # - Bounded actions only (apply at most `--max-actions`, and keep deltas within guardrails)
@@ -32,13 +33,29 @@
 # ====================================================================================================
 
 import argparse
+import copy
+import hashlib
 import json
+import multiprocessing
+import os
+import shutil
 import sys
-from datetime import datetime, timezone
+import time
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable
 
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+    pacsv = None
+
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 sys.path.insert(0, str(ROOT / "scripts"))
@@ -59,20 +76,64 @@ from src.sim import get_scenario, scenario_to_dict
 # Why it matters: Keeps runs isolated, reproducible, and easy to inspect in a demo.
 # ----------------------------------------------------------------------------------------------------
 def _default_out_dir(root: Path) -> Path:
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
     return root / "outputs" / f"agentic_demo_{timestamp}"
 
+# ----------------------------------------------------------------------------------------------------
+# _default_base_config
+# Purpose (simple): Build the demo baseline scenario config once per process.
+# Loop stage(s): Observe (config selection)
+# Inputs: None
+# Outputs: Cached config dict — callers must copy it (see `run_agentic_demo`) before handing it on
+# Why it matters: Seed sweeps call the demo many times per worker; the default config never changes.
+# ----------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=1)
+def _default_base_config() -> dict:
+    return scenario_to_dict(get_scenario("baseline", demo=True))
+
 # ----------------------------------------------------------------------------------------------------
 # _load_kpis
 # Purpose (simple): Load the KPI table produced by a simulation run.
 # Loop stage(s): Observe/Compare
-# Inputs: `path` to a `kpis.csv`
+# Inputs: `path` to a `kpis.csv` (a `kpis.feather` sibling is preferred when the runner wrote one)
 # Outputs: `pandas.DataFrame` of KPIs
 # Why it matters: Standardizes how we read KPIs for diagnosis and comparisons.
 # ----------------------------------------------------------------------------------------------------
 def _load_kpis(path: Path) -> pd.DataFrame:
+    feather_path = path.with_suffix(".feather")
+    if feather_path.exists():
+        return pd.read_feather(feather_path)
     return pd.read_csv(path)
 
+# ----------------------------------------------------------------------------------------------------
+# _atomic_write
+# Purpose (simple): Write a file via a temp sibling + rename, so readers never see a partial file.
+# Loop stage(s): Decide/Apply/Compare (artifact writing)
+# Inputs: `path` (final file), `write` (callable that writes the content to the temp path it is given)
+# Outputs: None (the file appears at `path` all at once)
+# Why it matters: A killed run (or a parallel sweep) can't leave a truncated `comparison.json` behind.
+# ----------------------------------------------------------------------------------------------------
+def _atomic_write(path: Path, write: Callable[[Path], object]) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    write(tmp)
+    os.replace(tmp, path)
+
+# ----------------------------------------------------------------------------------------------------
+# _write_csv
+# Purpose (simple): Persist a comparison table as CSV (Arrow's C++ writer when pyarrow is installed).
+# Loop stage(s): Compare (artifact writing)
+# Inputs: `path` (where to write), `df` (table to write; the index is dropped)
+# Outputs: None (writes a CSV file atomically)
+# Why it matters: Sweeps stack many seeds into one table; Arrow writes it much faster than `to_csv`.
+# ----------------------------------------------------------------------------------------------------
+def _write_csv(path: Path, df: pd.DataFrame) -> None:
+    if pacsv is None:
+        _atomic_write(path, lambda tmp: df.to_csv(tmp, index=False))
+        return
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    options = pacsv.WriteOptions(quoting_style="needed")
+    _atomic_write(path, lambda tmp: pacsv.write_csv(table, tmp, write_options=options))
+
 # ----------------------------------------------------------------------------------------------------
 # _write_json
 # Purpose (simple): Persist a small dictionary payload as pretty-printed JSON.
@@ -82,7 +143,8 @@ def _load_kpis(path: Path) -> pd.DataFrame:
 # Why it matters: Makes the demo auditable — you can open the files and see what the agent decided.
 # ----------------------------------------------------------------------------------------------------
 def _write_json(path: Path, payload: dict) -> None:
-    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    text = json.dumps(payload, indent=2)
+    _atomic_write(path, lambda tmp: tmp.write_text(text, encoding="utf-8"))
 
 # ----------------------------------------------------------------------------------------------------
 # _format_value
@@ -97,6 +159,21 @@ def _format_value(value: float | None) -> str:
         return "n/a"
     return f"{value:.2f}"
 
+# Baseline/after/delta lines for total_time in the summary; filled in one pass by `_build_summary`.
+_TOTAL_TIME_TEMPLATE = (
+    "- Baseline total_time mean/p95: {baseline_mean} / {baseline_p95}\n"
+    "- After total_time mean/p95: {after_mean} / {after_p95}\n"
+    "- Delta total_time mean/p95: {delta_mean} / {delta_p95}"
+)
+_TOTAL_TIME_FIELDS = (
+    "baseline_mean",
+    "baseline_p95",
+    "after_mean",
+    "after_p95",
+    "delta_mean",
+    "delta_p95",
+)
+
 # ----------------------------------------------------------------------------------------------------
 # _build_summary
 # Purpose (simple): Write a single markdown page summarizing diagnostics, decisions, and outcomes.
@@ -147,23 +224,67 @@ def _build_summary(
         lines.append("- Applied actions: none")
 
     if comparison:
-        metrics = comparison.get("metrics", [])
-        total_row = next((row for row in metrics if row.get("metric") == "total_time"), {})
-        lines.append(
-            "- Baseline total_time mean/p95: "
-            f"{_format_value(total_row.get('baseline_mean'))} / {_format_value(total_row.get('baseline_p95'))}"
-        )
-        lines.append(
-            "- After total_time mean/p95: "
-            f"{_format_value(total_row.get('after_mean'))} / {_format_value(total_row.get('after_p95'))}"
-        )
-        lines.append(
-            "- Delta total_time mean/p95: "
-            f"{_format_value(total_row.get('delta_mean'))} / {_format_value(total_row.get('delta_p95'))}"
-        )
+        by_metric = {row.get("metric"): row for row in comparison.get("metrics", [])}
+        total_row = by_metric.get("total_time", {})
+        fields = {key: _format_value(total_row.get(key)) for key in _TOTAL_TIME_FIELDS}
+        lines.append(_TOTAL_TIME_TEMPLATE.format_map(fields))
 
     summary_path = out_dir / "agentic_summary.md"
-    summary_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    text = "\n".join(lines) + "\n"
+    _atomic_write(summary_path, lambda tmp: tmp.write_text(text, encoding="utf-8"))
+
+# ----------------------------------------------------------------------------------------------------
+# _run_simulation_cached
+# Purpose (simple): Run one simulation, or reuse an identical earlier run from a content-addressed cache.
+# Loop stage(s): Observe/Re-run
+# Inputs: `config` + `seed` (what is simulated), `run_dir` (where artifacts go), `cache_dir` (None = no cache)
+# Outputs: The run's metadata dict with `kpis_df` (as returned by `run_demo`); `run_dir` gets `kpis.csv`,
+# `metadata.json`, etc.
+# Why it matters: Same config + seed + code version => same KPIs, so re-running the demo with a different
+# `--max-actions` does not need to re-simulate an unchanged baseline.
+# ----------------------------------------------------------------------------------------------------
+def _run_simulation_cached(config: dict, seed: int, run_dir: Path, cache_dir: Path | None) -> dict:
+    if cache_dir is None:
+        return run_simulation.run_demo(config, seed=seed, out_dir=run_dir)
+
+    key_payload = {
+        "config": config,
+        "seed": seed,
+        "git_commit": run_simulation.get_git_commit(ROOT),
+    }
+    key = hashlib.sha256(json.dumps(key_payload, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+    entry = cache_dir / key
+    if (entry / "kpis.csv").exists():
+        shutil.copytree(entry, run_dir, dirs_exist_ok=True)
+        metadata = json.loads((run_dir / "metadata.json").read_text(encoding="utf-8"))
+        # The cached artifacts describe the run that filled the cache: point `outputs` at this
+        # run_dir and flag the reuse, so the audit trail doesn't claim a fresh simulation.
+        outputs = metadata.get("outputs", {})
+        relocated = {
+            "kpis_csv": run_dir / "kpis.csv",
+            "kpis_feather": run_dir / "kpis.feather",
+            "plots_dir": run_dir / "plots",
+            "run_log": run_dir / "run.log",
+        }
+        for name, path in relocated.items():
+            if outputs.get(name):
+                outputs[name] = str(path.as_posix())
+        metadata["cache_hit"] = True
+        _write_json(run_dir / "metadata.json", metadata)
+        with (run_dir / "run.log").open("a", encoding="utf-8") as log_file:
+            log_file.write(f"Restored from simulation cache entry {key} (no re-simulation).\n")
+        return {**metadata, "kpis_df": _load_kpis(run_dir / "kpis.csv")}
+
+    metadata = run_simulation.run_demo(config, seed=seed, out_dir=run_dir)
+    # Publish via rename so parallel runs never see a half-copied cache entry.
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    staging = cache_dir / f"{key}.tmp{os.getpid()}"
+    shutil.copytree(run_dir, staging, dirs_exist_ok=True)
+    try:
+        staging.rename(entry)
+    except OSError:
+        shutil.rmtree(staging, ignore_errors=True)
+    return metadata
 
 # ----------------------------------------------------------------------------------------------------
 # run_agentic_demo
@@ -174,6 +295,7 @@ def _build_summary(
 # - `seed`: RNG seed reused across baseline and after runs (deterministic comparison)
 # - `max_actions`: cap on how many parameter changes we are allowed to apply
 # - `base_config`: optional explicit baseline config; otherwise load the repo's demo baseline scenario
+# - `cache_dir`: optional simulation cache (see `_run_simulation_cached`); None always re-simulates
 # Outputs: A result dict for the CLI (decision, whether we applied, applied_actions, and summary path)
 # Why it matters: This is the "Option B" demo loop in one place — a small, auditable, guardrailed agent workflow.
 # ----------------------------------------------------------------------------------------------------
@@ -182,6 +304,7 @@ def run_agentic_demo(
     seed: int,
     max_actions: int,
     base_config: dict | None = None,
+    cache_dir: Path | None = None,
 ) -> dict:
     out_dir.mkdir(parents=True, exist_ok=True)
     baseline_dir = out_dir / "baseline"
@@ -189,10 +312,11 @@ def run_agentic_demo(
 
     # Observe: pick a baseline configuration (either provided explicitly, or the demo baseline scenario).
     if base_config is None:
-        base_config = scenario_to_dict(get_scenario("baseline", demo=True))
+        # Deep copy: the config holds lists, and the cached default must stay pristine.
+        base_config = copy.deepcopy(_default_base_config())
 
     # Observe: run the baseline simulation and write `baseline/kpis.csv`, `baseline/metadata.json`, logs, plots.
-    run_simulation.run_demo(base_config, seed=seed, out_dir=baseline_dir)
+    baseline_metadata = _run_simulation_cached(base_config, seed, baseline_dir, cache_dir)
 
     # Diagnose: read the baseline KPIs and produce a diagnostics payload (incl. confidence + bottlenecks).
     kpis_path = baseline_dir / "kpis.csv"
@@ -213,7 +337,7 @@ def run_agentic_demo(
             "summary_path": summary_path,
         }
 
-    baseline_metadata = json.loads((baseline_dir / "metadata.json").read_text(encoding="utf-8"))
+    # The runner returns its metadata, so `config_used` comes straight from memory (no re-read).
     baseline_config = baseline_metadata.get("config_used") or base_config
 
     # Apply: convert recommendations into concrete config overrides (bounded by `max_actions` and guardrails).
@@ -238,19 +362,30 @@ def run_agentic_demo(
     _write_json(out_dir / "overrides.json", overrides)
 
     # Re-run: run the "after" simulation with the same seed and the updated configuration.
-    config_after = dict(baseline_config)
-    config_after.update(overrides)
-    run_simulation.run_demo(config_after, seed=seed, out_dir=after_dir)
+    # ChainMap lookups try `overrides` first, so overrides win on key conflicts (same as `dict.update`).
+    config_after = dict(ChainMap(overrides, baseline_config))
+    after_metadata = _run_simulation_cached(config_after, seed, after_dir, cache_dir)
 
-    # Compare: load KPI tables, compute deltas, and write comparison artifacts (JSON + CSV).
-    baseline_df = _load_kpis(baseline_dir / "kpis.csv")
-    after_df = _load_kpis(after_dir / "kpis.csv")
+    # Compare: take the KPI tables the runs handed back (no CSV re-read) and compute deltas.
+    baseline_df = baseline_metadata["kpis_df"]
+    after_df = after_metadata["kpis_df"]
     comparison, comparison_df = compare_kpis(baseline_df, after_df)
-    _write_json(out_dir / "comparison.json", comparison)
-    comparison_df.to_csv(out_dir / "comparison.csv", index=False)
 
-    # Compare/Report: generate a markdown summary that ties diagnostics → actions → outcomes together.
-    _build_summary(out_dir, diagnostics, decision, applied_actions, comparison)
+    # Compare/Report: the comparison artifacts and the markdown summary (diagnostics → actions → outcomes)
+    # target distinct paths, so write them concurrently and overlap the disk I/O.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(_write_json, out_dir / "comparison.json", comparison),
+            executor.submit(_write_csv, out_dir / "comparison.csv", comparison_df),
+            executor.submit(_build_summary, out_dir, diagnostics, decision, applied_actions, comparison),
+        ]
+        # Feather needs pyarrow; without it the JSON/CSV artifacts still carry the comparison.
+        if pa is not None:
+            futures.append(
+                executor.submit(_atomic_write, out_dir / "comparison.feather", comparison_df.to_feather)
+            )
+        for future in futures:
+            future.result()
     return {
         "decision": decision,
         "applied": True,
@@ -259,19 +394,81 @@ def run_agentic_demo(
         "summary_path": summary_path,
     }
 
+# ----------------------------------------------------------------------------------------------------
+# run_agentic_batch
+# Purpose (simple): Run the same bounded demo for several seeds in parallel (a robustness sweep).
+# Loop stage(s): Orchestration (wraps the full loop once per seed)
+# Inputs:
+# - `out_dir`: root folder; each seed writes a complete demo bundle under `seed_<seed>/`
+# - `seeds`: RNG seeds to sweep (each seed keeps its own deterministic baseline vs after comparison)
+# - `max_actions`, `base_config`, `cache_dir`: passed through to `run_agentic_demo`
+# - `jobs`: worker process cap (default: one per CPU)
+# Outputs: Dict of seed -> `run_agentic_demo` result; also writes `batch_comparison.csv`
+# Why it matters: Seeds are independent, so a sweep scales with cores instead of running back to back.
+# On Linux workers are forked, so they inherit the already-imported pandas/SimPy/sim modules instead of
+# re-importing them cold (other platforms keep their default start method).
+# ----------------------------------------------------------------------------------------------------
+def run_agentic_batch(
+    out_dir: Path,
+    seeds: list[int],
+    max_actions: int,
+    base_config: dict | None = None,
+    jobs: int | None = None,
+    cache_dir: Path | None = None,
+) -> dict[int, dict]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # Fork only on Linux: macOS defaults to spawn because forking is unsafe with its system frameworks.
+    mp_context = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=mp_context) as executor:
+        futures = {
+            seed: executor.submit(
+                run_agentic_demo,
+                out_dir / f"seed_{seed}",
+                seed,
+                max_actions,
+                base_config,
+                cache_dir,
+            )
+            for seed in seeds
+        }
+        results = {seed: future.result() for seed, future in futures.items()}
+
+    # Compare: stack the per-seed metric rows into one table (seeds without a re-run are skipped).
+    frames = []
+    for seed, result in results.items():
+        comparison = result.get("comparison")
+        if comparison:
+            frame = pd.DataFrame(comparison.get("metrics", []))
+            frame.insert(0, "seed", seed)
+            frames.append(frame)
+    if frames:
+        batch_df = pd.concat(frames, ignore_index=True)
+        _write_csv(out_dir / "batch_comparison.csv", batch_df)
+    return results
+
 # ----------------------------------------------------------------------------------------------------
 # parse_args
 # Purpose (simple): Define the CLI for the Option B demo.
 # Loop stage(s): Orchestration (not part of the simulation loop itself)
-# Inputs: Command-line args (`--seed`, `--max-actions`, `--out`)
+# Inputs: Command-line args (`--seed`/`--seeds`, `--max-actions`, `--jobs`, `--out`, `--cache`)
 # Outputs: `argparse.Namespace`
 # Why it matters: Makes the demo repeatable with the same seed and bounded action budget.
 # ----------------------------------------------------------------------------------------------------
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Run Option B agentic demo with auto-apply.")
     parser.add_argument("--seed", type=int, default=123)
+    parser.add_argument(
+        "--seeds",
+        help="Comma-separated seeds to sweep in parallel (e.g. 1,2,3); overrides --seed.",
+    )
     parser.add_argument("--max-actions", type=int, default=2)
+    parser.add_argument("--jobs", type=int, help="Worker processes for --seeds (default: CPU count).")
     parser.add_argument("--out", help="Output directory path.")
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse identical simulation runs from outputs/_cache (keyed by config, seed, git commit).",
+    )
     return parser.parse_args()
 
 
@@ -286,7 +483,22 @@ def parse_args() -> argparse.Namespace:
 def main() -> int:
     args = parse_args()
     out_dir = Path(args.out) if args.out else _default_out_dir(ROOT)
-    result = run_agentic_demo(out_dir=out_dir, seed=args.seed, max_actions=args.max_actions)
+    cache_dir = ROOT / "outputs" / "_cache" if args.cache else None
+    seeds = [int(seed) for seed in args.seeds.split(",") if seed.strip()] if args.seeds else []
+    if len(seeds) > 1:
+        results = run_agentic_batch(
+            out_dir, seeds, max_actions=args.max_actions, jobs=args.jobs, cache_dir=cache_dir
+        )
+        print(f"Wrote agentic demo outputs for {len(results)} seeds to {out_dir}")
+        for seed, result in results.items():
+            print(f"seed {seed}: applied={result.get('applied')} summary={result.get('summary_path')}")
+        return 0
+    if seeds:
+        args.seed = seeds[0]
+
+    result = run_agentic_demo(
+        out_dir=out_dir, seed=args.seed, max_actions=args.max_actions, cache_dir=cache_dir
+    )
     applied_actions = result.get("applied_actions") or []
     summary_path = result.get("summary_path")
     print(f"Wrote agentic demo outputs to {out_dir}")
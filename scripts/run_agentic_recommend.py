@@ -1,7 +1,8 @@
 import argparse
 import json
+import os
 import sys
-from datetime import datetime, timezone
+import time
 from pathlib import Path
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -11,21 +12,34 @@ from src.agent.diagnose import diagnose
 from src.agent.recommend import recommend
 
 
+def _iter_kpis_csv(root: Path):
+    # Walk with os.scandir (explicit stack) so mtimes come from the DirEntry instead of a stat per Path.
+    stack = [str(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name == "kpis.csv" and entry.is_file():
+                        yield entry.stat().st_mtime, entry.path
+        except OSError:
+            continue
+
+
 def _default_input(root: Path) -> Path:
     baseline = root / "outputs" / "web" / "baseline.json"
     if baseline.exists():
         return baseline
 
-    outputs_dir = root / "outputs"
-    candidates = list(outputs_dir.rglob("kpis.csv")) if outputs_dir.exists() else []
-    if not candidates:
+    latest = max(_iter_kpis_csv(root / "outputs"), default=None)
+    if latest is None:
         raise FileNotFoundError("No outputs/web/baseline.json or outputs/**/kpis.csv found.")
-    candidates.sort(key=lambda path: path.stat().st_mtime, reverse=True)
-    return candidates[0]
+    return Path(latest[1])
 
 
 def _default_out_dir(root: Path) -> Path:
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    timestamp = time.strftime("%Y%m%d_%H%M%S", time.gmtime())
     return root / "outputs" / "agentic_runs" / timestamp
 
 
@@ -12,7 +12,7 @@
 # - Optional overrides JSON (validated/merged via `src/sim/overrides.py`)
 #
 # What it produces (file-based artifacts for auditability):
-# - `kpis.csv` (row-level simulation outputs used to compute KPIs)
+# - `kpis.csv` (row-level simulation outputs used to compute KPIs) + `kpis.feather` (same table, binary)
 # - `metadata.json` (scenario name/description, seed, timestamp, git_commit, config_used, etc.)
 # - `plots/*.png` (quick visuals for the demo)
 # - `run.log` (console-style log for traceability)
@@ -26,16 +26,17 @@
 import argparse
 import json
 import logging
+import logging.handlers
 import sys
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from subprocess import CalledProcessError, check_output
 
-import matplotlib
-
-matplotlib.use("Agg")
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 
 
 ROOT = Path(__file__).resolve().parents[1]
@@ -43,6 +44,10 @@ sys.path.insert(0, str(ROOT))
 
 from src.sim import apply_overrides, get_scenario, run_simulation, scenario_from_dict, scenario_to_dict
 
+# One logger for every demo run: the stdout handler is reused, only the `run.log` handler changes per run.
+_LOGGER = logging.getLogger("demo_run")
+_LOGGER.setLevel(logging.INFO)
+
 
 # ----------------------------------------------------------------------------------------------------
 # parse_args
@@ -71,7 +76,10 @@ def parse_args() -> argparse.Namespace:
 # Inputs: `root` (repo root Path)
 # Outputs: commit SHA string, or None if git isn't available
 # Why it matters in the interview: Helps prove which version of the code produced a given set of KPIs.
+# Cached per root: HEAD doesn't move during a run, so baseline/after runs share one `git` call
+# (`get_git_commit.cache_clear()` forces a fresh lookup).
 # ----------------------------------------------------------------------------------------------------
+@lru_cache(maxsize=4)
 def get_git_commit(root: Path) -> str | None:
     try:
         return check_output(["git", "rev-parse", "HEAD"], cwd=root).decode().strip()
@@ -90,17 +98,22 @@ def get_git_commit(root: Path) -> str | None:
 def plot_histogram(df: pd.DataFrame, column: str, title: str, xlabel: str, out_path: Path) -> bool:
     if df.empty or column not in df.columns:
         return False
-    series = df[column].dropna()
-    if series.empty:
+    # Drop missing values with one NumPy mask (pandas NA/None become NaN first).
+    values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+    values = values[~np.isnan(values)]
+    if values.size == 0:
         return False
-    plt.figure(figsize=(10, 5))
-    plt.hist(series, bins=30, edgecolor="black", alpha=0.8)
-    plt.title(title)
-    plt.xlabel(xlabel)
-    plt.ylabel("Count")
-    plt.tight_layout()
-    plt.savefig(out_path, dpi=150)
-    plt.close()
+    # Bin in NumPy and draw on a standalone Figure (Agg canvas), so nothing is registered with pyplot.
+    counts, edges = np.histogram(values, bins=30)
+    fig = Figure(figsize=(10, 5))
+    FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align="edge", edgecolor="black", alpha=0.8)
+    ax.set_title(title)
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel("Count")
+    fig.tight_layout()
+    fig.savefig(out_path, dpi=150)
     return True
 
 
@@ -145,7 +158,7 @@ def _build_config_dict(args: argparse.Namespace) -> dict:
 # Purpose (simple): Turn a config dict + seed into reproducible, file-based simulation artifacts.
 # Loop stage(s): Observe / Re-run
 # Inputs: `config_dict` (scenario + any overrides), `seed` (determinism), `out_dir` (artifact root)
-# Outputs: metadata dict (also written to `metadata.json`)
+# Outputs: metadata dict (also written to `metadata.json`) plus the in-memory KPI table under `kpis_df`
 # Why it matters in the interview:
 # - This is what the orchestrator calls for both baseline and after runs.
 # - After it returns, the orchestrator continues with Diagnose/Decide/Apply/Compare using the KPIs and metadata.
@@ -160,113 +173,142 @@ def run_demo(config_dict: dict, seed: int, out_dir: Path) -> dict:
     plots_dir.mkdir(parents=True, exist_ok=True)
 
     # Configure logging (write to `run.log` and also stream to stdout for interactive runs).
+    # `run.log` records are buffered in memory and written in one go when the run finishes (or on an ERROR).
     log_path = out_dir / "run.log"
-    logger = logging.getLogger(f"demo_run_{out_dir.name}")
-    logger.setLevel(logging.INFO)
-    logger.handlers.clear()
-    handler = logging.FileHandler(log_path, mode="w", encoding="utf-8")
-    handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    logger = _LOGGER
+    # Keep the stdout handler from earlier runs (unless `sys.stdout` was swapped); drop anything else,
+    # e.g. a `run.log` handler left behind by a run that raised.
+    for old_handler in list(logger.handlers):
+        if getattr(old_handler, "stream", None) is not sys.stdout:
+            logger.removeHandler(old_handler)
+            old_handler.close()
+    if not logger.handlers:
+        logger.addHandler(logging.StreamHandler(sys.stdout))
+    file_handler = logging.FileHandler(log_path, mode="w", encoding="utf-8")
+    file_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(message)s"))
+    handler = logging.handlers.MemoryHandler(capacity=10_000, target=file_handler)
     logger.addHandler(handler)
-    logger.addHandler(logging.StreamHandler(sys.stdout))
-
-    logger.info("Starting demo run: scenario=%s seed=%s", config.name, seed)
-    logger.info("Demo description: %s", config.description)
-
-    # Run the simulation core deterministically (same config + same seed => comparable KPIs).
-    df = run_simulation(config, seed=seed)
-    logger.info("Completed simulation with %s container rows.", len(df))
-
-    # Persist row-level outputs (the downstream KPI calculations read from this file).
-    kpis_path = out_dir / "kpis.csv"
-    df.to_csv(kpis_path, index=False)
-    logger.info("Wrote KPIs to %s", kpis_path)
-
-    # Generate plots: primary "total_time" distribution plus a queue-length plot (with a fallback).
-    total_plot = plots_dir / "total_time_hist.png"
-    ok_total = plot_histogram(
-        df,
-        "total_time",
-        "Total Time Distribution (Demo)",
-        "Minutes in system",
-        total_plot,
-    )
-    if ok_total:
-        logger.info("Saved plot %s", total_plot)
-    else:
-        logger.warning("Skipped total_time plot (missing data).")
-
-    queue_plot = plots_dir / "scanner_queue_len_hist.png"
-    ok_queue = plot_histogram(
-        df,
-        "scanner_queue_len_at_pickup",
-        "Scanner Queue Length at Pickup Request (Demo)",
-        "Queue length (count)",
-        queue_plot,
-    )
-    if ok_queue:
-        logger.info("Saved plot %s", queue_plot)
-    else:
-        logger.warning("Skipped scanner queue plot (missing data).")
-        fallback_plot = plots_dir / "yard_equipment_wait_hist.png"
+
+    try:
+        logger.info("Starting demo run: scenario=%s seed=%s", config.name, seed)
+        logger.info("Demo description: %s", config.description)
+
+        # Run the simulation core deterministically (same config + same seed => comparable KPIs).
+        df = run_simulation(config, seed=seed)
+        logger.info("Completed simulation with %s container rows.", len(df))
+
+        # Persist row-level outputs (the downstream KPI calculations read from this file).
+        kpis_path = out_dir / "kpis.csv"
+        df.to_csv(kpis_path, index=False)
+        logger.info("Wrote KPIs to %s", kpis_path)
+
+        # Binary sibling of `kpis.csv` for fast re-loads (the CSV stays for human inspection).
+        kpis_feather_path = out_dir / "kpis.feather"
+        try:
+            df.reset_index(drop=True).to_feather(kpis_feather_path)
+            logger.info("Wrote KPIs to %s", kpis_feather_path)
+        except ImportError:
+            # Drop a Feather file left by an earlier run here, or readers would prefer its stale KPIs.
+            kpis_feather_path.unlink(missing_ok=True)
+            kpis_feather_path = None
+            logger.warning("Skipped kpis.feather (pyarrow not installed).")
+
+        # Generate plots: primary "total_time" distribution plus a queue-length plot (with a fallback).
+        total_plot = plots_dir / "total_time_hist.png"
+        ok_total = plot_histogram(
+            df,
+            "total_time",
+            "Total Time Distribution (Demo)",
+            "Minutes in system",
+            total_plot,
+        )
+        if ok_total:
+            logger.info("Saved plot %s", total_plot)
+        else:
+            logger.warning("Skipped total_time plot (missing data).")
+
+        queue_plot = plots_dir / "scanner_queue_len_hist.png"
         ok_queue = plot_histogram(
             df,
-            "yard_equipment_wait",
-            "Yard Equipment Wait Distribution (Demo)",
-            "Minutes waiting for yard equipment",
-            fallback_plot,
+            "scanner_queue_len_at_pickup",
+            "Scanner Queue Length at Pickup Request (Demo)",
+            "Queue length (count)",
+            queue_plot,
         )
         if ok_queue:
-            logger.info("Saved plot %s", fallback_plot)
+            logger.info("Saved plot %s", queue_plot)
         else:
-            logger.warning("Skipped yard equipment wait plot (missing data).")
-
-    # Build `metadata.json` for governance/traceability:
-    # - seed + timestamp for reproducibility
-    # - git_commit for provenance
-    # - a small config summary for quick scanning
-    # - the full `config_used` dict for exact replay
-    metadata = {
-        "scenario_name": config.name,
-        "scenario_description": config.description,
-        "seed": seed,
-        "demo": True,
-        "timestamp_utc": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
-        "git_commit": get_git_commit(ROOT),
-        "row_count": int(len(df)),
-        "outputs": {
-            "kpis_csv": str(kpis_path.as_posix()),
-            "plots_dir": str(plots_dir.as_posix()),
-            "run_log": str(log_path.as_posix()),
-        },
-        "config_summary": {
-            "sim_time_mins": config.sim_time_mins,
-            "max_dwell_mins": config.max_dwell_mins,
-            "post_process_buffer_mins": config.post_process_buffer_mins,
-            "flow_mix": {
-                "import": config.p_import,
-                "export": config.p_export,
-                "transship": config.p_transship,
+            logger.warning("Skipped scanner queue plot (missing data).")
+            fallback_plot = plots_dir / "yard_equipment_wait_hist.png"
+            ok_queue = plot_histogram(
+                df,
+                "yard_equipment_wait",
+                "Yard Equipment Wait Distribution (Demo)",
+                "Minutes waiting for yard equipment",
+                fallback_plot,
+            )
+            if ok_queue:
+                logger.info("Saved plot %s", fallback_plot)
+            else:
+                logger.warning("Skipped yard equipment wait plot (missing data).")
+
+        # Build `metadata.json` for governance/traceability:
+        # - seed + timestamp for reproducibility
+        # - git_commit for provenance
+        # - a small config summary for quick scanning
+        # - the full `config_used` dict for exact replay
+        metadata = {
+            "scenario_name": config.name,
+            "scenario_description": config.description,
+            "seed": seed,
+            "demo": True,
+            "timestamp_utc": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+            "git_commit": get_git_commit(ROOT),
+            "row_count": int(len(df)),
+            "outputs": {
+                "kpis_csv": str(kpis_path.as_posix()),
+                "kpis_feather": str(kpis_feather_path.as_posix()) if kpis_feather_path else None,
+                "plots_dir": str(plots_dir.as_posix()),
+                "run_log": str(log_path.as_posix()),
             },
-            "resources": {
-                "cranes": config.num_cranes,
-                "yard_capacity": config.yard_capacity,
-                "yard_equipment": config.yard_equipment_capacity,
-                "scanners": config.num_scanners,
-                "loaders": config.num_loaders,
-                "gate_in": config.num_gate_in,
-                "gate_out": config.num_gate_out,
+            "config_summary": {
+                "sim_time_mins": config.sim_time_mins,
+                "max_dwell_mins": config.max_dwell_mins,
+                "post_process_buffer_mins": config.post_process_buffer_mins,
+                "flow_mix": {
+                    "import": config.p_import,
+                    "export": config.p_export,
+                    "transship": config.p_transship,
+                },
+                "resources": {
+                    "cranes": config.num_cranes,
+                    "yard_capacity": config.yard_capacity,
+                    "yard_equipment": config.yard_equipment_capacity,
+                    "scanners": config.num_scanners,
+                    "loaders": config.num_loaders,
+                    "gate_in": config.num_gate_in,
+                    "gate_out": config.num_gate_out,
+                },
             },
-        },
-        "config_used": config_dict,
-    }
-
-    metadata_path = out_dir / "metadata.json"
-    metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
-    logger.info("Wrote metadata to %s", metadata_path)
-
-    logger.info("Demo run complete.")
-    # Returning metadata lets the orchestrator (or tests) inspect what was actually executed.
-    return metadata
+            "config_used": config_dict,
+        }
+
+        metadata_path = out_dir / "metadata.json"
+        metadata_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+        logger.info("Wrote metadata to %s", metadata_path)
+
+        logger.info("Demo run complete.")
+        # Returning metadata lets the orchestrator (or tests) inspect what was actually executed;
+        # `kpis_df` hands over the KPI table we just wrote so in-process callers don't re-read it from disk.
+        return {**metadata, "kpis_df": df}
+    except Exception:
+        logger.exception("Demo run failed.")
+        raise
+    finally:
+        # Flush the buffered `run.log` records to disk and release the file, even if the run failed.
+        logger.removeHandler(handler)
+        handler.close()
+        file_handler.close()
 
 
 # ----------------------------------------------------------------------------------------------------
@@ -1,6 +1,9 @@
+import json
 import sys
 from pathlib import Path
 
+import pandas as pd
+
 ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(ROOT))
 
@@ -15,8 +18,15 @@ def _load_run_agentic_demo():
     return run_agentic_apply_demo.run_agentic_demo
 
 
-def test_agentic_apply_pipeline(tmp_path):
-    run_agentic_demo = _load_run_agentic_demo()
+def _load_run_agentic_batch():
+    scripts_dir = ROOT / "scripts"
+    sys.path.insert(0, str(scripts_dir))
+    import run_agentic_apply_demo
+
+    return run_agentic_apply_demo.run_agentic_batch
+
+
+def _small_base_config():
     base = scenario_to_dict(get_scenario("baseline", demo=True))
     base.update(
         {
@@ -28,6 +38,12 @@ def test_agentic_apply_pipeline(tmp_path):
             "hourly_truck_teu_rate": [1] * 24,
         }
     )
+    return base
+
+
+def test_agentic_apply_pipeline(tmp_path):
+    run_agentic_demo = _load_run_agentic_demo()
+    base = _small_base_config()
 
     result = run_agentic_demo(out_dir=tmp_path, seed=123, max_actions=2, base_config=base)
 
@@ -39,3 +55,36 @@ def test_agentic_apply_pipeline(tmp_path):
         assert (tmp_path / "after" / "metadata.json").exists()
         assert (tmp_path / "after" / "kpis.csv").exists()
         assert (tmp_path / "comparison.json").exists()
+
+
+def test_agentic_batch_runs_each_seed(tmp_path):
+    run_agentic_batch = _load_run_agentic_batch()
+    base = _small_base_config()
+
+    results = run_agentic_batch(tmp_path, [123, 124], max_actions=2, base_config=base, jobs=2)
+
+    assert sorted(results) == [123, 124]
+    for seed in (123, 124):
+        assert (tmp_path / f"seed_{seed}" / "baseline" / "kpis.csv").exists()
+        assert (tmp_path / f"seed_{seed}" / "decision.json").exists()
+        assert results[seed]["applied"]
+
+    batch_df = pd.read_csv(tmp_path / "batch_comparison.csv")
+    assert sorted(batch_df["seed"].unique()) == [123, 124]
+
+
+def test_agentic_cache_hit_rewrites_metadata(tmp_path):
+    run_agentic_demo = _load_run_agentic_demo()
+    base = _small_base_config()
+    cache_dir = tmp_path / "cache"
+
+    run_agentic_demo(tmp_path / "first", seed=123, max_actions=2, base_config=base, cache_dir=cache_dir)
+    run_agentic_demo(tmp_path / "second", seed=123, max_actions=2, base_config=base, cache_dir=cache_dir)
+
+    baseline_dir = tmp_path / "second" / "baseline"
+    metadata = json.loads((baseline_dir / "metadata.json").read_text(encoding="utf-8"))
+    assert metadata["cache_hit"] is True
+    assert metadata["outputs"]["kpis_csv"] == (baseline_dir / "kpis.csv").as_posix()
+    assert metadata["outputs"]["run_log"] == (baseline_dir / "run.log").as_posix()
+    first_metadata = tmp_path / "first" / "baseline" / "metadata.json"
+    assert "cache_hit" not in json.loads(first_metadata.read_text(encoding="utf-8"))
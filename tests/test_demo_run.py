@@ -1,8 +1,10 @@
 import shutil
 import subprocess
 import sys
+import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 
 class DemoRunTest(unittest.TestCase):
@@ -36,6 +38,23 @@ class DemoRunTest(unittest.TestCase):
         plots = list((out_dir / "plots").glob("*.png"))
         self.assertGreaterEqual(len(plots), 2)
 
+    def test_failed_run_still_writes_run_log(self):
+        root = Path(__file__).resolve().parents[1]
+        sys.path.insert(0, str(root / "scripts"))
+        import run_simulation
+
+        config = run_simulation.scenario_to_dict(run_simulation.get_scenario("baseline", demo=True))
+        with tempfile.TemporaryDirectory() as tmp:
+            out_dir = Path(tmp) / "failed_run"
+            with mock.patch.object(run_simulation, "run_simulation", side_effect=RuntimeError("boom")):
+                with self.assertRaises(RuntimeError):
+                    run_simulation.run_demo(config, seed=123, out_dir=out_dir)
+
+            log_text = (out_dir / "run.log").read_text(encoding="utf-8")
+            self.assertIn("Starting demo run", log_text)
+            self.assertIn("Demo run failed.", log_text)
+            self.assertIn("RuntimeError: boom", log_text)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,102 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "scripts" / "ingest"))
+
+import ingest_port_terminals_kpis as kpis
+
+
+HEADER_PAGE = (
+    "Overview of key performance indicators\n"
+    "Key performance area and indicatorUnit of measure Actual Actual Target Actual\n"
+    "2018 2019 2020 2020"
+)
+TABLE_PAGE = (
+    "Key performance area and indicatorUnit of measure Actual Actual Target Actual\n"
+    "2018 2019 2020 2020\n"
+    "Operational performance\n"
+    "Ship working hours hours 60 55 50 58\n"
+    "Truck turnaround time minutes 45 40 35 38"
+)
+
+
+class _FakePdfDocument:
+    # Stands in for `PdfDocument`: serves fixed page texts through the same interface.
+    def __init__(self, pages):
+        self.pages = pages
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return None
+
+    def __len__(self):
+        return len(self.pages)
+
+    def normalized_text(self, index):
+        return kpis.normalize_line(self.pages[index])
+
+
+def _extract(monkeypatch, pages):
+    monkeypatch.setattr(kpis, "PdfDocument", lambda pdf_path, backend: _FakePdfDocument(pages))
+    columns, meta = kpis.extract_kpis_from_pdf(Path("fake.pdf"), 2020)
+    rows = [dict(zip(kpis.COLUMNS, values)) for values in zip(*(columns[c] for c in kpis.COLUMNS))]
+    return rows, meta
+
+
+def test_rows_found_after_row_less_pages(monkeypatch):
+    # Heading page without rows, then a chart page, then the table: parsing must not give up early.
+    pages = [HEADER_PAGE, "Container volumes chart", TABLE_PAGE]
+    rows, meta = _extract(monkeypatch, pages)
+
+    assert len(rows) == 2
+    assert meta["start_page"] == 1
+    assert meta["end_page"] == 3
+
+
+def test_heading_section_wins_over_earlier_header_hint(monkeypatch):
+    # An early summary page matches the header hint, but the real KPI section comes later.
+    summary_page = (
+        "Key performance area and indicator 2019 2020 2021\n"
+        "Summary metric units 1 2 3"
+    )
+    pages = [
+        "Cover",
+        "Chairman's statement",
+        "Narrative",
+        "Narrative",
+        summary_page,
+        "Financial performance",
+        "Narrative",
+        HEADER_PAGE + "\n" + TABLE_PAGE,
+        "Financial performance review",
+    ]
+    rows, meta = _extract(monkeypatch, pages)
+
+    assert meta["start_page"] == 8
+    assert [row["kpi_name"] for row in rows] == ["Ship working hours", "Truck turnaround time"]
+
+
+def test_parsing_stops_at_stop_keyword(monkeypatch):
+    pages = [HEADER_PAGE + "\n" + TABLE_PAGE, "Financial performance review\nRevenue 1 2 3 4", TABLE_PAGE]
+    rows, meta = _extract(monkeypatch, pages)
+
+    assert len(rows) == 2
+    assert meta["end_page"] == 1
+
+
+def test_section_label_on_page_without_digits(monkeypatch):
+    # The section label sits alone on a page before the table rows start.
+    table_rows = (
+        "Key performance area and indicatorUnit of measure Actual Actual Target Actual\n"
+        "2018 2019 2020 2020\n"
+        "Ship working hours hours 60 55 50 58"
+    )
+    pages = [HEADER_PAGE, "Operational performance", table_rows]
+    rows, _ = _extract(monkeypatch, pages)
+
+    assert [(row["kpi_section"], row["kpi_name"]) for row in rows] == [
+        ("Operational performance", "Ship working hours")
+    ]